@@ -0,0 +1,123 @@
+"""Rule-based planner for trivial single-tool requests.
+
+Requests like "weather in Paris" or "add a task to buy milk" map to exactly one
+tool call, so a handful of regexes can plan them without an LLM round trip.
+Anything ambiguous (no rule, or more than one rule matching) returns None and
+falls through to the LLM planner.
+"""
+
+import re
+
+# The city runs to the end of the message (ignoring closing punctuation), so
+# nothing after it is silently dropped; letters may be from any script
+WEATHER_RE = re.compile(r"weather (?:in|for|at) ([^\W\d_][\w ,.'-]*?)[\s?.!]*$", re.I)
+# Task requests must be a command from the start of the message ("please add a
+# task to ..."), not a mention of one ("how do I add a task ...")
+ADD_TASK_RE = re.compile(
+    r"^\s*(?:(?:please|can you|could you|would you)\s+)*"
+    r"(?:add|create|remind me to) (?:a )?task\b(?:\s+to\b)?\s*(.*)$",
+    re.I,
+)
+NOTES_RE = re.compile(
+    r"(?:search|check|look (?:up|in)|find in) (?:my )?notes (?:for|about|on) (.+)"
+    r"|what do my notes say about (.+)",
+    re.I,
+)
+
+# Weather phrasing that needs more than current conditions
+FORECAST_RE = re.compile(r"\b(?:tomorrow|forecast|week|weekend|tonight)\b", re.I)
+
+# Phrasing that turns a task command into something else ("don't add a task")
+_TASK_NEGATION_RE = re.compile(r"\b(?:don'?t|do not|never|not|no)\b", re.I)
+
+# Trailing words that aren't part of a city name
+_WEATHER_TRAILING_RE = re.compile(r"(?:\s+(?:today|now|right now|currently|please))+$", re.I)
+
+# Words that mean the capture is more than a city ("Paris like", "my house",
+# "Paris then add a task")
+_NON_CITY_WORDS = frozenset({
+    "a", "also", "and", "an", "be", "going", "here", "home", "how", "is", "it", "like",
+    "me", "my", "our", "outside", "please", "then", "there", "this", "to", "will", "your",
+})
+
+# Longest city name (in words) the rule planner will accept
+_MAX_CITY_WORDS = 4
+
+
+# Description of the generic final step added to every rule-based plan
+SUMMARY_STEP_DESCRIPTION = "Summarize the result for the user"
+
+
+def _clean(value: str) -> str:
+    """Strip whitespace and trailing sentence punctuation from a captured value."""
+    return value.strip().rstrip(".?!").strip()
+
+
+def _plan(description: str, tool: str, tool_input: dict, speculation_safe: bool = False) -> list[dict]:
+    """Build a one-tool plan followed by the usual synthesis step."""
+    return [
+        {
+            "step": 1,
+            "description": description,
+            "tool": tool,
+            "tool_input": tool_input,
+            "depends_on": [],
+            "speculation_safe": speculation_safe,
+        },
+        {"step": 2, "description": SUMMARY_STEP_DESCRIPTION, "tool": None, "tool_input": None, "depends_on": [1]},
+    ]
+
+
+def _weather_plan(match: re.Match) -> list[dict] | None:
+    city = _WEATHER_TRAILING_RE.sub("", _clean(match.group(1))).strip(" ,")
+    # Leftover words ("Paris like", "Paris and London") need the LLM planner
+    words = city.replace(",", " ").lower().split()
+    if not words or len(words) > _MAX_CITY_WORDS or any(w in _NON_CITY_WORDS for w in words):
+        return None
+    return _plan(f"Get the current weather for {city}", "get_weather", {"city": city})
+
+
+def _task_plan(match: re.Match) -> list[dict] | None:
+    task = _clean(match.group(1))
+    if not task:
+        return None
+    # The task's confirmation isn't needed to phrase the answer
+    return _plan(f"Add task: {task}", "add_task", {"task": task}, speculation_safe=True)
+
+
+def _notes_plan(match: re.Match) -> list[dict] | None:
+    query = _clean(match.group(1) or match.group(2))
+    if not query:
+        return None
+    return _plan(f"Search notes for {query}", "search_notes", {"query": query})
+
+
+def fast_plan(message: str) -> list[dict] | None:
+    """Plan a trivial request without the LLM.
+
+    Args:
+        message: The user's latest message.
+
+    Returns:
+        A plan if exactly one rule matches unambiguously, otherwise None.
+    """
+    matches = []
+
+    weather = WEATHER_RE.search(message)
+    if weather and not FORECAST_RE.search(message):
+        matches.append((weather, _weather_plan))
+
+    task = ADD_TASK_RE.search(message)
+    # Adding a task writes to disk, so questions and negations go to the LLM
+    if task and not message.rstrip().endswith("?") and not _TASK_NEGATION_RE.search(message):
+        matches.append((task, _task_plan))
+
+    notes = NOTES_RE.search(message)
+    if notes:
+        matches.append((notes, _notes_plan))
+
+    if len(matches) != 1:
+        return None
+
+    match, build = matches[0]
+    return build(match)
@@ -1,25 +1,43 @@
 """Multi-agent LangGraph graph with planner → worker → explainer flow."""
 
+import asyncio
 import json
 import logging
-from typing import Annotated, Any, TypedDict
-
+import re
+import os
+import threading
+from functools import lru_cache
+from typing import Annotated, Any, NotRequired, TypedDict
+
+import json_repair
+import orjson
 from langchain_core.messages import AnyMessage, HumanMessage, SystemMessage, AIMessage
+from langgraph.cache.base import BaseCache
+from langgraph.cache.memory import InMemoryCache
+from langgraph.cache.redis import RedisCache
+from langgraph.config import get_stream_writer
 from langgraph.graph import StateGraph, START, END
 from langgraph.graph.message import add_messages
+from langgraph.types import CachePolicy
 
+from backend.agents.fast_planner import SUMMARY_STEP_DESCRIPTION, fast_plan
+from backend.agents.llm_cache import with_llm_cache
+from backend.agents.plan_cache import PlanCache, is_plan_cache_enabled
 from backend.models import get_model_client
-from backend.tools.weather import get_weather
+from backend.tools.weather import get_temperature, get_weather, get_weather_batch
 from backend.tools.tasks import add_task
 from backend.tools.notes import search_notes
 from backend.mcp.config import is_mcp_enabled
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+try:
+    import redis
+except ImportError:  # Optional - only needed for NODE_CACHE_REDIS_URL
+    redis = None
+
 logger = logging.getLogger(__name__)
 
 # Define the base tools available to the worker
-BASE_TOOLS = [get_weather, add_task, search_notes]
+BASE_TOOLS = [get_weather, get_weather_batch, get_temperature, add_task, search_notes]
 TOOLS = list(BASE_TOOLS)  # Will be extended with MCP tools
 TOOL_MAP = {tool.name: tool for tool in TOOLS}
 
@@ -30,6 +48,8 @@ class PlanStep(TypedDict):
     description: str
     tool: str | None
     tool_input: dict | None
+    depends_on: NotRequired[list[int]]
+    speculation_safe: NotRequired[bool]
 
 
 class ContextLogEntry(TypedDict):
@@ -39,12 +59,24 @@ class ContextLogEntry(TypedDict):
     result: str
 
 
+# Oldest context log entries are dropped past this many
+CONTEXT_LOG_MAX_ENTRIES = 100
+
+
+def append_context_log(
+    existing: list[ContextLogEntry] | None, new: list[ContextLogEntry] | None
+) -> list[ContextLogEntry]:
+    """Reducer for context_log: append new entries, keeping only the most recent."""
+    merged = (existing or []) + (new or [])
+    return merged[-CONTEXT_LOG_MAX_ENTRIES:]
+
+
 class MultiAgentState(TypedDict):
     """State for the multi-agent graph."""
     messages: Annotated[list[AnyMessage], add_messages]
     plan: list[PlanStep] | None
     current_step: int
-    context_log: list[ContextLogEntry]
+    context_log: Annotated[list[ContextLogEntry], append_context_log]
     final_answer: str | None
 
 
@@ -65,8 +97,8 @@ def get_planner_system_prompt(tools: list) -> str:
     
     json_example = '''{
   "plan": [
-    {"step": 1, "description": "Brief description of what to do", "tool": "tool_name or null", "tool_input": {"param": "value"} or null},
-    {"step": 2, "description": "...", "tool": "...", "tool_input": {...}}
+    {"step": 1, "description": "Brief description of what to do", "tool": "tool_name or null", "tool_input": {"param": "value"} or null, "depends_on": []},
+    {"step": 2, "description": "...", "tool": "...", "tool_input": {"param": "$step_1"}, "depends_on": [1]}
   ]
 }'''
     
@@ -81,15 +113,177 @@ Analyze the user's message and output a JSON plan with this exact format:
 Guidelines:
 - If the user asks about their notes, fitness, recipes, or personal information, use search_notes
 - If the user asks about weather, use get_weather
+- If the user asks about weather in more than one city, use one get_weather_batch step with all the cities
+- If the user only asks for the temperature in a city, use get_temperature
 - If the user wants to add/create a task or reminder, use add_task
 - If the user wants to search the web for current information, use brave_web_search with query parameter
 - Do NOT use brave_summarizer - it requires a special key from prior searches
 - You can have multiple steps that use different tools
+- Steps run in parallel unless they list the steps they need in "depends_on"
+- To use an earlier step's result as a tool input, write "$step_N" (e.g. "$step_1") and add N to "depends_on"
+- Set "speculation_safe": true on a step whose result only confirms an action (e.g. add_task) and isn't needed to write the answer
 - Steps without tools are for reasoning/synthesis (set tool to null)
 - Always end with a synthesis step (tool: null) to combine results
 
 Output ONLY valid JSON, nothing else."""
 
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+
+def parse_plan_json(content: str) -> dict:
+    """Parse the planner's JSON response.
+    
+    Ignores any text around the outermost {...} (e.g. markdown code fences) and
+    repairs malformed JSON (trailing commas, missing brackets) rather than
+    giving up on the plan.
+    
+    Raises:
+        ValueError: If no JSON object can be recovered.
+    """
+    match = _JSON_OBJECT_RE.search(content)
+    if match:
+        content = match.group(0)
+    
+    try:
+        plan_data = orjson.loads(content)
+    except orjson.JSONDecodeError as e:
+        logger.warning(f"Repairing malformed plan JSON: {e}")
+        plan_data = json_repair.loads(content)
+    
+    if not isinstance(plan_data, dict):
+        raise ValueError(f"Expected a JSON object, got {type(plan_data).__name__}")
+    return plan_data
+
+
+_STEP_REF_RE = re.compile(r"\$step_(\d+)")
+
+
+def _step_dependencies(step: PlanStep) -> set[int]:
+    """Collect the step numbers a plan step waits on (depends_on + $step_N references)."""
+    deps = set()
+    for dep in step.get("depends_on") or []:
+        try:
+            deps.add(int(dep))
+        except (TypeError, ValueError):
+            continue
+    if step.get("tool_input"):
+        deps.update(int(n) for n in _STEP_REF_RE.findall(json.dumps(step["tool_input"])))
+    return deps
+
+
+def schedule_waves(plan: list[PlanStep]) -> list[list[int]]:
+    """Group plan step indices into waves whose steps can run concurrently.
+    
+    Each wave only contains steps whose dependencies finished in earlier waves.
+    Unknown step references are ignored; a dependency cycle falls back to
+    running the remaining steps one at a time in plan order.
+    """
+    known = {step["step"] for step in plan}
+    pending = {i: _step_dependencies(step) & known for i, step in enumerate(plan)}
+    done: set[int] = set()
+    waves = []
+    
+    while pending:
+        wave = [i for i, deps in pending.items() if deps <= done]
+        if not wave:
+            wave = [min(pending)]
+        for i in wave:
+            del pending[i]
+            done.add(plan[i]["step"])
+        waves.append(wave)
+    
+    return waves
+
+
+def _resolve_step_refs(value: Any, results: dict[int, str]) -> Any:
+    """Replace "$step_N" placeholders in a tool input with step N's result."""
+    if isinstance(value, str):
+        return _STEP_REF_RE.sub(lambda m: results.get(int(m.group(1)), m.group(0)), value)
+    if isinstance(value, dict):
+        return {k: _resolve_step_refs(v, results) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_resolve_step_refs(v, results) for v in value]
+    return value
+
+
+def is_error_entry(entry: ContextLogEntry) -> bool:
+    """Check if a context log entry records a failed tool call."""
+    return entry["result"].startswith("Error:")
+
+
+def _serializable(value: Any) -> Any:
+    """Return `value` if it's JSON-serializable as-is, otherwise its string form."""
+    if hasattr(value, "content"):
+        return value.content
+    if isinstance(value, (dict, list, str, int, float, bool, type(None))):
+        return value
+    return str(value)
+
+
+# Longest tool result kept in the context log (and so in the explainer prompt)
+EXPLAINER_RESULT_MAX_CHARS = 300
+
+_WEATHER_SUMMARY_FIELDS = ("error", "city", "country", "temp", "feels_like", "humidity", "conditions", "wind_speed")
+
+
+def _summarize_weather(result: dict) -> dict:
+    return {k: result[k] for k in _WEATHER_SUMMARY_FIELDS if k in result}
+
+
+def _summarize_weather_batch(result: list[dict]) -> list[str]:
+    # Capped per city, so every city survives (see ITEMWISE_CAPPED_TOOLS)
+    return [json.dumps(_summarize_weather(r))[:EXPLAINER_RESULT_MAX_CHARS] for r in result]
+
+
+def _summarize_notes(result: list[dict]) -> list[dict]:
+    # Only the best match - the rest rarely changes the answer
+    return [{"content": r["content"], "source": r["source"]} for r in result[:1]]
+
+
+def _summarize_task(result: dict) -> dict:
+    return {"status": result["status"]}
+
+
+# Tools whose summaries cap each item themselves and so skip the overall cap
+ITEMWISE_CAPPED_TOOLS = frozenset({"get_weather_batch"})
+
+# Per-tool reducers that keep only what the explainer needs from a result
+_EXPLAINER_SUMMARIES = {
+    "get_weather": _summarize_weather,
+    "get_weather_batch": _summarize_weather_batch,
+    "get_temperature": _summarize_weather,
+    "search_notes": _summarize_notes,
+    "add_task": _summarize_task,
+}
+
+
+def summarize_for_explainer(tool_name: str, result: Any) -> Any:
+    """Trim a tool result down to the fields the explainer needs.
+    
+    Args:
+        tool_name: Name of the tool that produced the result.
+        result: The raw tool result.
+        
+    Returns:
+        The summarized result, or `result` unchanged for tools without a
+        summary or results of an unexpected shape.
+    """
+    summarize = _EXPLAINER_SUMMARIES.get(tool_name)
+    if summarize is None:
+        return result
+    try:
+        return summarize(result)
+    except (KeyError, TypeError):
+        return result
+
+
+async def _ainvoke_tool(tool: Any, tool_input: dict) -> Any:
+    """Invoke a tool without blocking the event loop."""
+    if getattr(tool, "coroutine", None) is not None:
+        return await tool.ainvoke(tool_input)
+    return await asyncio.to_thread(tool.invoke, tool_input)
+
+
 WORKER_SYSTEM_PROMPT = """You are a worker agent executing a plan step. You have access to tools.
 
 Based on the current step, call the appropriate tool if specified. If no tool is needed, just acknowledge the step.
@@ -112,6 +306,170 @@ Your response should:
 Be helpful, concise, and natural. Do not output JSON or technical details."""
 
 
+EXPLAINER_TEMPERATURE = 0.7
+
+# Constant prompt pieces, built once instead of per request
+_EXPLAINER_SYSTEM_MESSAGE = SystemMessage(content=EXPLAINER_SYSTEM_PROMPT)
+_EXPLAINER_PROMPT_FOOTER = "\n\nNow provide a helpful, natural response to the user based on the above information."
+
+
+def build_explainer_messages(state: MultiAgentState) -> list[AnyMessage]:
+    """Build the explainer prompt from the plan and context log in `state`."""
+    messages = state["messages"]
+    plan = state.get("plan") or []
+    context_log = state.get("context_log") or []
+    
+    # Build context for explainer
+    user_request = messages[-1].content if messages else "No request"
+    
+    plan_summary = "\n".join([
+        f"- Step {s['step']}: {s['description']}" + (f" (tool: {s['tool']})" if s.get('tool') else "")
+        for s in plan
+    ])
+    
+    context_summary = "\n".join([
+        f"- Step {c['step']}: {c['action']}\n  Result: {c['result']}"
+        for c in context_log
+    ])
+    
+    explainer_prompt = (
+        f"User request: {user_request}\n\n"
+        f"Execution plan:\n{plan_summary}\n\n"
+        f"Results from execution:\n{context_summary}"
+        f"{_EXPLAINER_PROMPT_FOOTER}"
+    )
+    
+    return [_EXPLAINER_SYSTEM_MESSAGE, HumanMessage(content=explainer_prompt)]
+
+
+def _weather_response(tool_input: dict, result: dict) -> str | None:
+    if "error" in result:
+        return None
+    place = f"{result['city']}, {result['country']}" if result.get("country") else result["city"]
+    return (
+        f"It's currently {result['temp']} and {result['conditions']} in {place} "
+        f"(feels like {result['feels_like']}), with {result['humidity']} humidity "
+        f"and wind at {result['wind_speed']}."
+    )
+
+
+def _add_task_response(tool_input: dict, result: dict) -> str | None:
+    if result.get("status") != "success":
+        return None
+    return f"Done! I've added \"{tool_input['task']}\" to your task list."
+
+
+# Canned answers for tools whose result needs no rephrasing, keyed by tool name.
+# Each takes (tool_input, result) and returns None if the result doesn't fit.
+TEMPLATE_RESPONSES = {
+    "get_weather": _weather_response,
+    "add_task": _add_task_response,
+}
+
+
+def template_answer(state: MultiAgentState) -> str | None:
+    """Answer a single-tool plan from a template instead of the explainer LLM.
+
+    Only plans made of one tool step plus the generic summary step (as built
+    by the fast planner) qualify. Any other reasoning step means the user asked
+    something the result alone doesn't answer ("should I bring an umbrella?").
+
+    Returns:
+        The templated answer, or None if the plan doesn't qualify, the tool
+        has no template, or the step failed.
+    """
+    plan = state.get("plan") or []
+    tool_steps = [s for s in plan if s.get("tool")]
+    if len(tool_steps) != 1 or tool_steps[0]["tool"] not in TEMPLATE_RESPONSES:
+        return None
+    if any(not s.get("tool") and s.get("description") != SUMMARY_STEP_DESCRIPTION for s in plan):
+        return None
+
+    step = tool_steps[0]
+    entry = next((c for c in state.get("context_log") or [] if c["step"] == step["step"]), None)
+    if entry is None or is_error_entry(entry):
+        return None
+
+    try:
+        result = orjson.loads(entry["result"])
+    except orjson.JSONDecodeError:
+        return None
+    if not isinstance(result, dict):
+        return None
+
+    try:
+        return TEMPLATE_RESPONSES[step["tool"]](step.get("tool_input") or {}, result)
+    except (KeyError, TypeError):
+        return None
+
+
+# Model clients per (provider, role, temperature, streaming), shared by every
+# graph built for the same provider
+@lru_cache(maxsize=None)
+def _get_role_model(provider: str, role: str, temperature: float, streaming: bool):
+    """Get or create the model client for an agent role."""
+    model = get_model_client(provider=provider, streaming=streaming, temperature=temperature)
+    if provider == "openai" and role in ("planner", "explainer"):
+        # The system prompt is the first, unchanging message of every call.
+        # A stable cache key routes those calls to the same OpenAI prompt
+        # cache so the prefix is billed and processed as cached tokens.
+        model = model.bind(prompt_cache_key=f"lifehub-{role}")
+    return with_llm_cache(model) if role == "planner" else model
+
+
+def log_prompt_cache_usage(role: str, response: Any) -> None:
+    """Log how many input tokens were served from the provider's prompt cache."""
+    usage = getattr(response, "usage_metadata", None)
+    if not usage:
+        return
+    cached = (usage.get("input_token_details") or {}).get("cache_read", 0)
+    logger.info("%s prompt cache: %s/%s input tokens cached", role, cached, usage.get("input_tokens", 0))
+
+
+def get_explainer_model(provider: str = "openai"):
+    """Get the streaming model used by the explainer agent.
+    
+    Lets callers stream the final answer directly from the model instead of
+    going through the graph's event stream.
+    """
+    return _get_role_model(provider, "explainer", EXPLAINER_TEMPERATURE, True)
+
+
+# Node cache TTLs (seconds) - tool results go stale sooner than plans
+PLANNER_CACHE_TTL = 60 * 60
+WORKER_CACHE_TTL = 10 * 60
+
+# Tools without side effects, whose results may be replayed from the node cache
+CACHEABLE_TOOLS = frozenset({"get_weather", "get_weather_batch", "get_temperature", "search_notes"})
+
+# Worker nodes: plans using only CACHEABLE_TOOLS run on "cached_worker" when
+# the node cache is enabled, everything else on the uncached "worker"
+WORKER_NODES = ("worker", "cached_worker")
+
+
+def is_cacheable_plan(plan: list[PlanStep]) -> bool:
+    """Check if every tool in a plan is safe to replay from the node cache."""
+    return all(not step.get("tool") or step["tool"] in CACHEABLE_TOOLS for step in plan)
+
+
+@lru_cache(maxsize=1)
+def get_node_cache() -> BaseCache | None:
+    """Get the LangGraph node cache, or None if NODE_CACHE_ENABLED is not set.
+    
+    Entries live in Redis when NODE_CACHE_REDIS_URL is set, otherwise in an
+    unbounded in-process cache that is only meant for development.
+    """
+    if os.getenv("NODE_CACHE_ENABLED", "").lower() not in ("1", "true", "yes"):
+        return None
+    
+    redis_url = os.getenv("NODE_CACHE_REDIS_URL")
+    if not redis_url:
+        return InMemoryCache()
+    if redis is None:
+        raise RuntimeError("NODE_CACHE_REDIS_URL requires the 'redis' package (pip install redis)")
+    return RedisCache(redis.Redis.from_url(redis_url))
+
+
 def create_multi_agent_graph(provider: str = "openai", mcp_tools: list | None = None):
     """Create and compile the multi-agent LangGraph graph.
     
@@ -128,59 +486,81 @@ def create_multi_agent_graph(provider: str = "openai", mcp_tools: list | None =
     tool_map = {tool.name: tool for tool in all_tools}
     
     # Get model clients for each agent role
-    planner_model = get_model_client(provider=provider, streaming=False, temperature=0.3)
-    worker_model = get_model_client(provider=provider, streaming=False, temperature=0.2)
+    # Planner runs at temperature 0 so identical requests produce cacheable plans
+    planner_model = _get_role_model(provider, "planner", 0, False)
+    worker_model = _get_role_model(provider, "worker", 0.2, False)
     worker_model_with_tools = worker_model.bind_tools(all_tools)
-    explainer_model = get_model_client(provider=provider, streaming=True, temperature=0.7)
+    explainer_model = get_explainer_model(provider)
     
     # Generate planner prompt with all available tools
-    planner_system_prompt = get_planner_system_prompt(all_tools)
+    planner_system_message = SystemMessage(content=get_planner_system_prompt(all_tools))
     
-    def planner_node(state: MultiAgentState) -> dict:
+    # Optional semantic cache of plans (skips the planner LLM on similar requests)
+    plan_cache = PlanCache() if is_plan_cache_enabled() else None
+    
+    async def planner_node(state: MultiAgentState) -> dict:
         """Planner agent: analyzes request and creates execution plan."""
         logger.info("=== PLANNER NODE ===")
         
         messages = state["messages"]
         
+        # Trivial single-tool requests are planned by rules, skipping the LLM
+        if messages:
+            rule_plan = fast_plan(messages[-1].content)
+            if rule_plan is not None:
+                logger.info("Fast planner matched: %s", rule_plan[0]["tool"])
+                return {
+                    "plan": rule_plan,
+                    "current_step": 0,
+                    "context_log": [],
+                }
+        
+        if plan_cache is not None and messages:
+            # The lookup embeds the request with a blocking HTTP call
+            cached_plan = await asyncio.to_thread(plan_cache.lookup, messages[-1].content)
+            if cached_plan is not None:
+                return {
+                    "plan": cached_plan,
+                    "current_step": 0,
+                    "context_log": [],
+                }
+        
         # Build planner prompt
         planner_messages = [
-            SystemMessage(content=planner_system_prompt),
+            planner_system_message,
             HumanMessage(content=f"User request: {messages[-1].content if messages else 'No message'}")
         ]
         
-        response = planner_model.invoke(planner_messages)
-        logger.info(f"Planner raw response: {response.content}")
+        response = await planner_model.ainvoke(planner_messages)
+        log_prompt_cache_usage("Planner", response)
+        logger.info("Planner raw response: %s", response.content)
         
         # Parse the plan from JSON response
         try:
-            # Extract JSON from response (handle markdown code blocks)
-            content = response.content.strip()
-            if content.startswith("```"):
-                # Remove markdown code block
-                lines = content.split("\n")
-                content = "\n".join(lines[1:-1] if lines[-1] == "```" else lines[1:])
-            
-            plan_data = json.loads(content)
+            plan_data = parse_plan_json(response.content)
             plan = plan_data.get("plan", [])
             
             # Validate and normalize plan
-            normalized_plan = []
-            for i, step in enumerate(plan):
-                normalized_plan.append({
+            normalized_plan = [
+                {
                     "step": step.get("step", i + 1),
                     "description": step.get("description", ""),
                     "tool": step.get("tool"),
                     "tool_input": step.get("tool_input"),
-                })
+                    "depends_on": step.get("depends_on") or [],
+                    "speculation_safe": bool(step.get("speculation_safe")),
+                }
+                for i, step in enumerate(plan)
+            ]
             
-            logger.info(f"Parsed plan: {json.dumps(normalized_plan, indent=2)}")
+            logger.debug("Parsed plan: %s", normalized_plan)
             
             return {
                 "plan": normalized_plan,
                 "current_step": 0,
                 "context_log": [],
             }
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             logger.error(f"Failed to parse plan JSON: {e}")
             # Fallback: create a simple direct response plan
             return {
@@ -189,141 +569,195 @@ def create_multi_agent_graph(provider: str = "openai", mcp_tools: list | None =
                 "context_log": [],
             }
     
-    def worker_node(state: MultiAgentState) -> dict:
-        """Worker agent: executes all plan steps by directly invoking tools."""
-        logger.info("=== WORKER NODE ===")
+    async def execute_step(step: PlanStep, results: dict[int, str]) -> ContextLogEntry:
+        """Execute a single plan step, recording its result for later steps."""
+        step_num = step["step"]
+        description = step["description"]
+        tool_name = step.get("tool")
         
-        plan = state.get("plan", [])
-        context_log = list(state.get("context_log", []))
+        logger.info("Executing step %s: %s", step_num, description)
         
-        # Execute all steps in the plan
-        for step in plan:
-            step_num = step["step"]
-            description = step["description"]
-            tool_name = step.get("tool")
-            tool_input = step.get("tool_input") or {}
-            
-            logger.info(f"Executing step {step_num}: {description}")
-            
-            if tool_name and tool_name in tool_map:
-                # Directly invoke the tool
-                try:
-                    tool = tool_map[tool_name]
-                    result = tool.invoke(tool_input)
-                    
-                    # Convert result to string
-                    if isinstance(result, dict):
-                        result_str = json.dumps(result)
-                    elif isinstance(result, list):
-                        result_str = json.dumps(result)
-                    else:
-                        result_str = str(result)
-                    
-                    logger.info(f"Tool {tool_name} returned: {result_str[:200]}...")
-                    
-                    context_log.append({
-                        "step": step_num,
-                        "action": f"{tool_name}({json.dumps(tool_input)})",
-                        "result": result_str[:1000],  # Truncate long results
-                    })
-                except Exception as e:
-                    logger.error(f"Tool {tool_name} failed: {e}")
-                    context_log.append({
-                        "step": step_num,
-                        "action": f"{tool_name}({json.dumps(tool_input)})",
-                        "result": f"Error: {str(e)}",
-                    })
-            else:
-                # No tool needed, just log the reasoning step
-                context_log.append({
-                    "step": step_num,
-                    "action": description,
-                    "result": "Reasoning/synthesis step completed",
-                })
+        if not (tool_name and tool_name in tool_map):
+            # No tool needed, just log the reasoning step
+            return {
+                "step": step_num,
+                "action": description,
+                "result": "Reasoning/synthesis step completed",
+            }
         
-        logger.info(f"Worker completed {len(plan)} steps")
+        # Never run a tool on an error message in place of a dependency's result
+        failed = sorted(d for d in _step_dependencies(step) if results.get(d, "").startswith("Error:"))
+        if failed:
+            logger.warning("Skipping step %s: dependency step %s failed", step_num, failed[0])
+            results[step_num] = f"Error: skipped: dependency step {failed[0]} failed"
+            return {
+                "step": step_num,
+                "action": f"{tool_name}(skipped)",
+                "result": results[step_num],
+            }
         
-        return {
-            "context_log": context_log,
-        }
+        tool_input = _resolve_step_refs(step.get("tool_input") or {}, results)
+        action = f"{tool_name}({json.dumps(tool_input)})"
+        write_event = get_stream_writer()
+        try:
+            write_event({"type": "tool_start", "name": tool_name, "input": tool_input})
+            result = await _ainvoke_tool(tool_map[tool_name], tool_input)
+            write_event({"type": "tool_end", "name": tool_name, "output": _serializable(result)})
+            
+            # Convert result to string
+            result_str = json.dumps(result) if isinstance(result, (dict, list)) else str(result)
+            
+            logger.info("Tool %s returned: %.200s...", tool_name, result_str)
+            # Later steps get the full result, the context log a trimmed one
+            results[step_num] = result_str
+            summary = summarize_for_explainer(tool_name, result)
+            summary_str = json.dumps(summary) if isinstance(summary, (dict, list)) else str(summary)
+            if tool_name not in ITEMWISE_CAPPED_TOOLS:
+                summary_str = summary_str[:EXPLAINER_RESULT_MAX_CHARS]  # Truncate long results
+            
+            return {
+                "step": step_num,
+                "action": action,
+                "result": summary_str,
+            }
+        except Exception as e:
+            logger.error("Tool %s failed: %s", tool_name, e)
+            results[step_num] = f"Error: {str(e)}"
+            return {
+                "step": step_num,
+                "action": action,
+                "result": results[step_num],
+            }
     
-    def explainer_node(state: MultiAgentState) -> dict:
-        """Explainer agent: produces final user-friendly response."""
-        logger.info("=== EXPLAINER NODE ===")
+    async def run_step(step: PlanStep, results: dict[int, str]) -> ContextLogEntry:
+        """Execute a plan step and publish its context log entry as soon as it's done."""
+        entry = await execute_step(step, results)
+        get_stream_writer()({"type": "step", **entry})
+        return entry
+    
+    async def worker_node(state: MultiAgentState) -> dict:
+        """Worker agent: executes plan steps, running independent tool calls concurrently."""
+        logger.info("=== WORKER NODE ===")
         
-        messages = state["messages"]
         plan = state.get("plan", [])
-        context_log = state.get("context_log", [])
         
-        # Build context for explainer
-        user_request = messages[-1].content if messages else "No request"
+        # Slots are filled by plan index so the log stays in step order
+        # regardless of which concurrent tool call finishes first
+        entries: list[ContextLogEntry | None] = [None] * len(plan)
+        results: dict[int, str] = {}
         
-        plan_summary = "\n".join([
-            f"- Step {s['step']}: {s['description']}" + (f" (tool: {s['tool']})" if s.get('tool') else "")
-            for s in plan
-        ])
+        for wave in schedule_waves(plan):
+            wave_entries = await asyncio.gather(*(run_step(plan[i], results) for i in wave))
+            for i, entry in zip(wave, wave_entries):
+                entries[i] = entry
         
-        context_summary = "\n".join([
-            f"- Step {c['step']}: {c['action']}\n  Result: {c['result']}"
-            for c in context_log
-        ])
+        # Only cache plans that used tools and ran without errors
+        messages = state.get("messages") or []
+        if (
+            plan_cache is not None
+            and messages
+            and any(step.get("tool") for step in plan)
+            and not any(is_error_entry(entry) for entry in entries)
+        ):
+            plan_cache.store(messages[-1].content, plan)
         
-        explainer_prompt = f"""User request: {user_request}
-
-Execution plan:
-{plan_summary}
-
-Results from execution:
-{context_summary}
-
-Now provide a helpful, natural response to the user based on the above information."""
+        logger.info("Worker completed %d steps", len(plan))
         
-        explainer_messages = [
-            SystemMessage(content=EXPLAINER_SYSTEM_PROMPT),
-            HumanMessage(content=explainer_prompt),
-        ]
+        # Only the new entries - the append_context_log reducer merges them
+        return {
+            "context_log": entries,
+        }
+    
+    async def explainer_node(state: MultiAgentState) -> dict:
+        """Explainer agent: produces final user-friendly response."""
+        logger.info("=== EXPLAINER NODE ===")
+        
+        answer = template_answer(state)
+        if answer is not None:
+            logger.info("Explainer answered from template")
+            return {
+                "final_answer": answer,
+                "messages": [AIMessage(content=answer)],
+            }
         
-        response = explainer_model.invoke(explainer_messages)
-        logger.info(f"Explainer response generated")
+        response = await explainer_model.ainvoke(build_explainer_messages(state))
+        log_prompt_cache_usage("Explainer", response)
+        logger.info("Explainer response generated")
         
         return {
             "final_answer": response.content,
             "messages": [AIMessage(content=response.content)],
         }
     
+    # Node cache keys are scoped to the provider and tool set, since both
+    # change what the planner produces
+    cache_scope = f"{provider}:{len(all_tools)}"
+    
+    def planner_cache_key(state: MultiAgentState) -> str:
+        messages = state.get("messages") or []
+        return f"{cache_scope}:{messages[-1].content if messages else ''}"
+    
+    def worker_cache_key(state: MultiAgentState) -> str:
+        return f"{cache_scope}:{json.dumps(state.get('plan') or [], sort_keys=True)}"
+    
+    def route_worker(state: MultiAgentState) -> str:
+        # Side effects (e.g. add_task) must never be replayed, and writing
+        # entries for them would only fill the cache with keys nobody reads
+        return "cached_worker" if is_cacheable_plan(state.get("plan") or []) else "worker"
+    
+    # The explainer isn't cached: it streams and runs at a non-zero temperature
+    node_cache = get_node_cache()
+    planner_cache_policy = None
+    if node_cache is not None:
+        planner_cache_policy = CachePolicy(key_func=planner_cache_key, ttl=PLANNER_CACHE_TTL)
+    
     # Create the graph
     graph = StateGraph(MultiAgentState)
     
     # Add nodes
-    graph.add_node("planner", planner_node)
+    graph.add_node("planner", planner_node, cache_policy=planner_cache_policy)
     graph.add_node("worker", worker_node)
     graph.add_node("explainer", explainer_node)
     
     # Add edges: simple linear flow
     # START → planner → worker → explainer → END
     graph.add_edge(START, "planner")
-    graph.add_edge("planner", "worker")
     graph.add_edge("worker", "explainer")
     graph.add_edge("explainer", END)
     
+    if node_cache is None:
+        graph.add_edge("planner", "worker")
+    else:
+        # Side-effect-free plans go through a cached copy of the worker
+        worker_cache_policy = CachePolicy(key_func=worker_cache_key, ttl=WORKER_CACHE_TTL)
+        graph.add_node("cached_worker", worker_node, cache_policy=worker_cache_policy)
+        graph.add_conditional_edges("planner", route_worker, list(WORKER_NODES))
+        graph.add_edge("cached_worker", "explainer")
+    
     # Compile and return
-    return graph.compile()
+    return graph.compile(cache=node_cache)
 
 
 # Lazy initialization - graphs cached per provider
-_multi_agent_graphs: dict[str, Any] = {}
+_graph_build_lock = threading.Lock()
+
+
+@lru_cache(maxsize=4)
+def _build_multi_agent_graph(provider: str):
+    return create_multi_agent_graph(provider=provider)
 
 
+@lru_cache(maxsize=4)
 def get_multi_agent_graph(provider: str = "openai"):
     """Get or create the multi-agent graph (lazy initialization).
     
     Args:
         provider: Model provider to use ("openai" or "ollama")
     """
-    global _multi_agent_graphs
-    if provider not in _multi_agent_graphs:
-        _multi_agent_graphs[provider] = create_multi_agent_graph(provider=provider)
-    return _multi_agent_graphs[provider]
+    # lru_cache alone lets two concurrent first calls both compile a graph;
+    # the lock plus the inner cache makes the second caller reuse the first's
+    with _graph_build_lock:
+        return _build_multi_agent_graph(provider)
 
 
 # Alias for backward compatibility
@@ -1,5 +1,7 @@
 """LangGraph single-agent graph with tool support."""
 
+import threading
+from functools import lru_cache
 from typing import Annotated, TypedDict
 
 from langchain_core.messages import AnyMessage, HumanMessage, SystemMessage
@@ -87,16 +89,21 @@ def create_agent_graph(provider: str = "openai"):
 
 
 # Lazy initialization - graphs cached per provider
-_agent_graphs: dict[str, any] = {}
+_graph_build_lock = threading.Lock()
 
 
+@lru_cache(maxsize=4)
+def _build_agent_graph(provider: str):
+    return create_agent_graph(provider=provider)
+
+
+@lru_cache(maxsize=4)
 def get_agent_graph(provider: str = "openai"):
     """Get or create the agent graph (lazy initialization).
     
     Args:
         provider: Model provider to use ("openai" or "ollama")
     """
-    global _agent_graphs
-    if provider not in _agent_graphs:
-        _agent_graphs[provider] = create_agent_graph(provider=provider)
-    return _agent_graphs[provider]
+    # The lock plus the inner cache stops concurrent first calls from both compiling
+    with _graph_build_lock:
+        return _build_agent_graph(provider)
@@ -0,0 +1,178 @@
+"""LLM response cache - serves repeated deterministic prompts without an API call.
+
+Only temperature-0 calls are cached, since those are expected to return the
+same answer for the same prompt. Keys are a SHA-256 of the model, messages,
+and temperature.
+
+Enable with LLM_CACHE_ENABLED=1. Responses are kept in an in-process LRU
+unless LLM_CACHE_REDIS_URL is set, in which case they are stored in Redis.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Protocol
+
+from langchain_core.messages import AIMessage, BaseMessage
+
+try:
+    import redis
+except ImportError:  # Optional - only needed for RedisBackend
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+# Default size of the in-memory cache
+LLM_CACHE_MAX_SIZE = 1024
+
+# Default expiry for Redis entries (seconds)
+LLM_CACHE_TTL = 24 * 60 * 60
+
+
+class CacheBackend(Protocol):
+    """Storage used by LLMCache."""
+
+    def get(self, key: str) -> str | None: ...
+
+    def set(self, key: str, value: str) -> None: ...
+
+
+class InMemoryLRU:
+    """Thread-safe in-process LRU cache."""
+
+    def __init__(self, max_size: int = LLM_CACHE_MAX_SIZE):
+        self._max_size = max_size
+        self._data: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self._max_size:
+                self._data.popitem(last=False)
+
+
+class RedisBackend:
+    """Redis-backed cache, shared across processes and restarts."""
+
+    def __init__(self, url: str, ttl: int = LLM_CACHE_TTL):
+        if redis is None:
+            raise RuntimeError("RedisBackend requires the 'redis' package (pip install redis)")
+        self._client = redis.Redis.from_url(url)
+        self._ttl = ttl
+
+    def get(self, key: str) -> str | None:
+        value = self._client.get(key)
+        return value.decode("utf-8") if value is not None else None
+
+    def set(self, key: str, value: str) -> None:
+        self._client.set(key, value, ex=self._ttl)
+
+
+class LLMCache:
+    """Exact-match cache of LLM responses."""
+
+    def __init__(self, backend: CacheBackend):
+        self._backend = backend
+
+    @staticmethod
+    def make_key(model: str, messages: list[BaseMessage], temperature: float) -> str:
+        """Build a cache key from the model id, messages, and temperature."""
+        payload = {
+            "model": model,
+            "messages": [{"type": m.type, "content": m.content} for m in messages],
+            "temperature": temperature,
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        try:
+            return self._backend.get(key)
+        except Exception as e:
+            logger.warning(f"LLM cache read failed: {e}")
+            return None
+
+    def set(self, key: str, value: str) -> None:
+        try:
+            self._backend.set(key, value)
+        except Exception as e:
+            logger.warning(f"LLM cache write failed: {e}")
+
+
+class CachedChatModel:
+    """Chat model wrapper that serves temperature-0 calls from an LLMCache.
+
+    Other attributes and methods are delegated to the wrapped model.
+    """
+
+    def __init__(self, model: Any, cache: LLMCache):
+        self._model = model
+        self._cache = cache
+        base_url = getattr(model, "openai_api_base", None) or ""
+        self._model_id = f"{base_url}|{getattr(model, 'model_name', '')}"
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._model, name)
+
+    def _key(self, messages: list[BaseMessage]) -> str | None:
+        temperature = getattr(self._model, "temperature", None)
+        if temperature != 0:
+            return None
+        return LLMCache.make_key(self._model_id, messages, temperature)
+
+    def invoke(self, messages: list[BaseMessage], *args, **kwargs) -> BaseMessage:
+        key = self._key(messages)
+        if key is not None and (cached := self._cache.get(key)) is not None:
+            logger.info("LLM cache hit")
+            return AIMessage(content=cached)
+
+        response = self._model.invoke(messages, *args, **kwargs)
+        if key is not None and isinstance(response.content, str):
+            self._cache.set(key, response.content)
+        return response
+
+    async def ainvoke(self, messages: list[BaseMessage], *args, **kwargs) -> BaseMessage:
+        key = self._key(messages)
+        if key is not None and (cached := self._cache.get(key)) is not None:
+            logger.info("LLM cache hit")
+            return AIMessage(content=cached)
+
+        response = await self._model.ainvoke(messages, *args, **kwargs)
+        if key is not None and isinstance(response.content, str):
+            self._cache.set(key, response.content)
+        return response
+
+
+_llm_cache: LLMCache | None = None
+
+
+def get_llm_cache() -> LLMCache | None:
+    """Get the shared LLM cache, or None if LLM_CACHE_ENABLED is not set."""
+    global _llm_cache
+
+    if os.getenv("LLM_CACHE_ENABLED", "").lower() not in ("1", "true", "yes"):
+        return None
+
+    if _llm_cache is None:
+        redis_url = os.getenv("LLM_CACHE_REDIS_URL")
+        backend = RedisBackend(redis_url) if redis_url else InMemoryLRU()
+        _llm_cache = LLMCache(backend)
+
+    return _llm_cache
+
+
+def with_llm_cache(model: Any) -> Any:
+    """Wrap a chat model with the shared LLM cache if caching is enabled."""
+    cache = get_llm_cache()
+    return CachedChatModel(model, cache) if cache is not None else model
@@ -0,0 +1,165 @@
+"""Semantic plan cache - reuses planner output for goals similar to earlier ones.
+
+Plans are keyed by the embedding of the user's request. On a hit, tool inputs
+that were copied from the cached request (e.g. the city in "weather in Paris")
+are re-filled from the new request, so the planner LLM call can be skipped.
+
+Enable with PLAN_CACHE_ENABLED=1.
+"""
+
+import copy
+import logging
+import os
+import re
+import threading
+
+import numpy as np
+
+from backend.rag.embeddings import get_single_embedding
+
+logger = logging.getLogger(__name__)
+
+# Cosine similarity required to reuse a cached plan
+PLAN_CACHE_THRESHOLD = 0.90
+
+# Maximum number of cached plans (least frequently used are evicted first)
+PLAN_CACHE_MAX_SIZE = 256
+
+# Tool inputs referring to an earlier step's result (see graph._STEP_REF_RE)
+_STEP_REF_RE = re.compile(r"\$step_(\d+)")
+
+
+def is_plan_cache_enabled() -> bool:
+    """Check if the plan cache is enabled via PLAN_CACHE_ENABLED."""
+    return os.getenv("PLAN_CACHE_ENABLED", "").lower() in ("1", "true", "yes")
+
+
+def _extract_slot(value: str, cached_goal: str, goal: str) -> str | None:
+    """Find the part of `goal` that plays the role `value` played in `cached_goal`.
+
+    Uses the text around `value` in the cached goal as a template, e.g.
+    "weather in {Paris}" applied to "weather in London" gives "London".
+    Returns None if the new goal doesn't fit the template.
+    """
+    idx = cached_goal.lower().find(value.lower())
+    if idx < 0:
+        return None
+
+    prefix = cached_goal[:idx].lower()
+    suffix = cached_goal[idx + len(value):].lower()
+    lowered = goal.lower()
+    if not (lowered.startswith(prefix) and lowered.endswith(suffix)):
+        return None
+
+    slot = goal[len(prefix):len(goal) - len(suffix)].strip()
+    return slot or None
+
+
+def _adapt_plan(plan: list[dict], cached_goal: str, goal: str) -> list[dict] | None:
+    """Re-fill the query-derived tool inputs of a cached plan for a new goal.
+
+    Every non-empty string input must either be a "$step_N" reference or
+    appear in the cached goal, so it can be re-filled from the new one. Other
+    strings (e.g. "Paris, France" planned for "weather in Paris") can't be
+    adapted safely, and neither can lists or dicts (e.g. the cities of a
+    batch lookup). Returns None for those, or if any slot can't be filled.
+    """
+    adapted = copy.deepcopy(plan)
+
+    for step in adapted:
+        tool_input = step.get("tool_input") or {}
+        for key, value in tool_input.items():
+            if isinstance(value, (list, dict)):
+                return None
+            if not isinstance(value, str) or not value or _STEP_REF_RE.search(value):
+                continue
+            if value.lower() not in cached_goal.lower():
+                return None
+
+            slot = _extract_slot(value, cached_goal, goal)
+            if slot is None:
+                return None
+
+            tool_input[key] = slot
+            step["description"] = step.get("description", "").replace(value, slot)
+
+    return adapted
+
+
+class PlanCache:
+    """In-memory cache of plans keyed by goal embedding, with LFU eviction."""
+
+    def __init__(
+        self,
+        threshold: float = PLAN_CACHE_THRESHOLD,
+        max_size: int = PLAN_CACHE_MAX_SIZE,
+    ):
+        self._threshold = threshold
+        self._max_size = max_size
+        self._goals: list[str] = []
+        self._plans: list[list[dict]] = []
+        self._hits: list[int] = []
+        self._vectors: np.ndarray | None = None
+        # Embeddings computed on a miss, kept until the plan is stored
+        self._pending: dict[str, np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._goals)
+
+    @staticmethod
+    def _embed(goal: str) -> np.ndarray:
+        """Embed a goal as a unit vector so a dot product gives cosine similarity."""
+        vector = np.asarray(get_single_embedding(goal), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, goal: str) -> list[dict] | None:
+        """Return an adapted cached plan for a similar goal, or None on a miss."""
+        try:
+            vector = self._embed(goal)
+        except Exception as e:
+            logger.warning(f"Plan cache lookup skipped, embedding failed: {e}")
+            return None
+
+        with self._lock:
+            if self._vectors is not None and self._goals:
+                similarities = self._vectors @ vector
+                best = int(np.argmax(similarities))
+                if similarities[best] >= self._threshold:
+                    plan = _adapt_plan(self._plans[best], self._goals[best], goal)
+                    if plan is not None:
+                        self._hits[best] += 1
+                        logger.info(f"Plan cache hit ({similarities[best]:.3f}) for: {goal}")
+                        return plan
+
+            # Remember the embedding so store() doesn't need to recompute it
+            if len(self._pending) >= self._max_size:
+                self._pending.pop(next(iter(self._pending)))
+            self._pending[goal] = vector
+
+        return None
+
+    def store(self, goal: str, plan: list[dict]) -> None:
+        """Cache a plan that was generated for `goal` after a lookup miss."""
+        with self._lock:
+            vector = self._pending.pop(goal, None)
+            if vector is None:
+                return
+
+            if len(self._goals) >= self._max_size:
+                self._evict()
+
+            self._goals.append(goal)
+            self._plans.append(copy.deepcopy(plan))
+            self._hits.append(0)
+            row = vector[np.newaxis, :]
+            self._vectors = row if self._vectors is None else np.vstack([self._vectors, row])
+
+    def _evict(self) -> None:
+        """Drop the least frequently used entry (oldest first on ties)."""
+        victim = int(np.argmin(self._hits))
+        del self._goals[victim]
+        del self._plans[victim]
+        del self._hits[victim]
+        self._vectors = np.delete(self._vectors, victim, axis=0)
@@ -0,0 +1,129 @@
+"""Speculative explainer - starts the final answer before every tool finishes.
+
+Plan steps marked "speculation_safe" only confirm an action (e.g. add_task);
+their result isn't needed to phrase the answer. Once every other tool step has
+finished, the explainer is started with those steps assumed successful, so
+its time-to-first-token overlaps with the remaining tool calls.
+
+Tokens are buffered until the worker finishes. If every speculated step did
+succeed they are released; otherwise the speculative call is cancelled and the
+explainer is re-run with the real results.
+
+Enable with SPECULATIVE_EXPLAINER=1.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from typing import Any, AsyncIterator
+
+from backend.agents.graph import build_explainer_messages, is_error_entry, template_answer
+
+logger = logging.getLogger(__name__)
+
+# Result assumed for speculation-safe steps that haven't finished yet
+SPECULATED_RESULT = "Completed successfully"
+
+
+def is_speculation_enabled() -> bool:
+    """Check if speculative explaining is enabled via SPECULATIVE_EXPLAINER."""
+    return os.getenv("SPECULATIVE_EXPLAINER", "").lower() in ("1", "true", "yes")
+
+
+class SpeculativeExplainer:
+    """Streams the explainer, starting it early when the plan allows."""
+
+    def __init__(self, model: Any, messages: list, enabled: bool | None = None):
+        self._model = model
+        self._messages = messages
+        self._enabled = is_speculation_enabled() if enabled is None else enabled
+        self._plan: list[dict] = []
+        self._entries: dict[int, dict] = {}
+        self._speculated: set[int] = set()
+        self._queue: asyncio.Queue[str | None] = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+
+    def set_plan(self, plan: list[dict]) -> None:
+        """Record the plan produced by the planner, speculating at once if it allows."""
+        self._plan = plan
+        # A plan whose only tool steps are safe never waits on a real result
+        self._maybe_speculate()
+
+    def on_step(self, entry: dict) -> None:
+        """Record a finished step and start speculating once only safe steps remain."""
+        self._entries[entry["step"]] = entry
+        self._maybe_speculate()
+
+    def _maybe_speculate(self) -> None:
+        """Start the explainer if every pending tool step is speculation-safe."""
+        if not self._enabled or self._task is not None:
+            return
+
+        pending = [s for s in self._plan if s.get("tool") and s["step"] not in self._entries]
+        if not pending or not all(s.get("speculation_safe") for s in pending):
+            return
+
+        self._speculated = {s["step"] for s in pending}
+        logger.info("Starting explainer speculatively, assuming steps %s succeed", sorted(self._speculated))
+        state = {
+            "messages": self._messages,
+            "plan": self._plan,
+            "context_log": [self._speculative_entry(s) for s in self._plan],
+        }
+        self._task = asyncio.create_task(self._prefetch(build_explainer_messages(state)))
+
+    def _speculative_entry(self, step: dict) -> dict:
+        """Context log entry for a step: its real result, or the assumed one."""
+        if step["step"] in self._entries:
+            return self._entries[step["step"]]
+        if step.get("tool"):
+            return {
+                "step": step["step"],
+                "action": f"{step['tool']}({json.dumps(step.get('tool_input') or {})})",
+                "result": SPECULATED_RESULT,
+            }
+        return {
+            "step": step["step"],
+            "action": step["description"],
+            "result": "Reasoning/synthesis step completed",
+        }
+
+    async def _prefetch(self, messages: list) -> None:
+        """Run the explainer, buffering its tokens in the queue."""
+        try:
+            async for chunk in self._model.astream(messages):
+                if chunk.content:
+                    self._queue.put_nowait(chunk.content)
+        finally:
+            self._queue.put_nowait(None)
+
+    async def stream(self, state: dict) -> AsyncIterator[str]:
+        """Yield explainer tokens for the final graph state."""
+        # Single-tool answers come from a template, as one token
+        answer = template_answer(state)
+        if answer is not None:
+            self.cancel()
+            yield answer
+            return
+
+        if self._task is not None:
+            final = {entry["step"]: entry for entry in state.get("context_log") or []}
+            if not any(step in final and is_error_entry(final[step]) for step in self._speculated):
+                while (content := await self._queue.get()) is not None:
+                    yield content
+                if not self._task.cancelled() and self._task.exception() is not None:
+                    raise self._task.exception()
+                return
+
+            logger.info("Speculated step failed, re-running explainer with real results")
+            self._task.cancel()
+
+        async for chunk in self._model.astream(build_explainer_messages(state)):
+            if chunk.content:
+                yield chunk.content
+
+    def cancel(self) -> None:
+        """Cancel any in-flight speculative call."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
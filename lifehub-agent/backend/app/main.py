@@ -1,8 +1,11 @@
 """FastAPI application with /chat endpoint using multi-agent LangGraph."""
 
+import asyncio
 import json
 import logging
+import os
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
@@ -11,14 +14,23 @@ from fastapi.responses import StreamingResponse
 from langchain_core.messages import HumanMessage, AIMessage
 from pydantic import BaseModel
 
-from backend.agents.graph import get_multi_agent_graph, create_multi_agent_graph
-from backend.mcp.client import get_mcp_tools
+from backend.agents.graph import WORKER_NODES, create_multi_agent_graph, get_explainer_model, get_multi_agent_graph
+from backend.agents.speculation import SpeculativeExplainer
+from backend.mcp.client import close_mcp_sessions, get_mcp_tools
 from backend.mcp.config import is_mcp_enabled
+from backend.models import prewarm_connections
+from backend.tools.weather import prewarm_weather_connections
 
-# Configure logging
+# Configure logging - startup messages at INFO, per-request agent/tool logs
+# at REQUEST_LOG_LEVEL (WARNING by default) to keep them off the streaming path.
+# Cache-hit and prompt-cache logs are INFO, so they need REQUEST_LOG_LEVEL=INFO.
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+REQUEST_LOG_LEVEL = os.getenv("REQUEST_LOG_LEVEL", "WARNING").upper()
+for _name in ("backend.agents", "backend.mcp.client", "backend.tools"):
+    logging.getLogger(_name).setLevel(REQUEST_LOG_LEVEL)
+
 
 # Store MCP tools globally after initialization
 _mcp_tools: list = []
@@ -59,17 +71,27 @@ async def lifespan(app: FastAPI):
         logger.info("MCP is enabled, initializing MCP tools...")
         try:
             _mcp_tools = await get_mcp_tools()
-            logger.info(f"Loaded {len(_mcp_tools)} MCP tools: {[t.name for t in _mcp_tools]}")
+            logger.info("Loaded %d MCP tools: %s", len(_mcp_tools), [t.name for t in _mcp_tools])
         except Exception as e:
-            logger.error(f"Failed to initialize MCP tools: {e}")
+            logger.error("Failed to initialize MCP tools: %s", e)
             _mcp_tools = []
     else:
         logger.info("MCP is not enabled (no BRAVE_API_KEY set)")
     
+    # Build graphs and open model connections now so the first request
+    # doesn't pay for client setup, tool binding, and graph compilation
+    for provider in ("openai", "ollama"):
+        try:
+            get_graph_with_mcp(provider=provider)
+        except Exception as e:
+            logger.warning("Could not prebuild %s graph: %s", provider, e)
+    await asyncio.gather(prewarm_connections(), prewarm_weather_connections())
+    
     yield
     
     # Cleanup on shutdown
     logger.info("Shutting down...")
+    await close_mcp_sessions()
 
 
 app = FastAPI(
@@ -121,17 +143,41 @@ def convert_messages(messages: list[Message]) -> list:
     return lc_messages
 
 
+# Pre-encoded SSE framing - per token only the content string is serialized
+_TOKEN_PREFIX = b'data: {"type": "token", "content": '
+_EVENT_SUFFIX = b"}\n\n"
+
+
+@lru_cache(maxsize=None)
+def _event_prefix(event_type: str) -> bytes:
+    """Encoded `data: {"type": ...` prefix for an event type."""
+    return f'data: {{"type": {json.dumps(event_type)}'.encode("utf-8")
+
+
+def _emit(event_type: str, **fields) -> bytes:
+    """Encode an SSE event as bytes."""
+    if not fields:
+        return _event_prefix(event_type) + _EVENT_SUFFIX
+    # Splice the fields object into the prebuilt prefix: '{"a": 1}' -> ', "a": 1}'
+    return _event_prefix(event_type) + b", " + json.dumps(fields)[1:].encode("utf-8") + b"\n\n"
+
+
+def _emit_token(content: str) -> bytes:
+    """Encode a token SSE event as bytes."""
+    return _TOKEN_PREFIX + json.dumps(content).encode("utf-8") + _EVENT_SUFFIX
+
+
 async def stream_response(
     messages: list[Message], 
     provider: str = "openai",
     debug: bool = False,
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     """Stream the multi-agent response using Server-Sent Events (SSE).
     
     Event types:
     - {"type": "start"}: Stream started
     - {"type": "plan", "plan": [...]}: Execution plan (debug mode)
-    - {"type": "step", "step": int, "action": str}: Step execution (debug mode)
+    - {"type": "step", "step": int, "action": str, "result": str}: Step completed (debug mode)
     - {"type": "token", "content": "..."}: Token from model
     - {"type": "tool_start", "name": "...", "input": {...}}: Tool execution started
     - {"type": "tool_end", "name": "...", "output": {...}}: Tool execution completed
@@ -144,19 +190,20 @@ async def stream_response(
     try:
         agent_graph = get_graph_with_mcp(provider=provider)
     except Exception as e:
-        logger.error(f"Failed to get agent graph: {e}")
-        yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+        logger.error("Failed to get agent graph: %s", e)
+        yield _emit("error", message=str(e))
         return
     
     # Signal stream start
-    yield f"data: {json.dumps({'type': 'start'})}\n\n"
+    yield _emit("start")
     
-    plan_sent = False
-    context_log_sent = False
+    # Streams the explainer, starting it early when SPECULATIVE_EXPLAINER is set
+    explainer = SpeculativeExplainer(get_explainer_model(provider), lc_messages)
     
     try:
-        # Stream events from the graph
-        async for event in agent_graph.astream_events(
+        # Phase 1: run planner + worker, stopping before the explainer node
+        state = None
+        async for mode, chunk in agent_graph.astream(
             {
                 "messages": lc_messages,
                 "plan": None,
@@ -164,57 +211,48 @@ async def stream_response(
                 "context_log": [],
                 "final_answer": None,
             },
-            version="v2",
+            stream_mode=["updates", "custom", "values"],
+            interrupt_before=["explainer"],
         ):
-            kind = event["event"]
-            
-            # Debug: send plan after planner completes
-            if debug and kind == "on_chain_end" and not plan_sent:
-                output = event.get("data", {}).get("output", {})
-                if isinstance(output, dict) and "plan" in output and output["plan"]:
-                    yield f"data: {json.dumps({'type': 'plan', 'plan': output['plan']})}\n\n"
-                    plan_sent = True
-            
-            # Debug: send context log updates
-            if debug and kind == "on_chain_end" and not context_log_sent:
-                output = event.get("data", {}).get("output", {})
-                if isinstance(output, dict) and "context_log" in output and output["context_log"]:
-                    # Only send if we have new entries
-                    yield f"data: {json.dumps({'type': 'context_log', 'log': output['context_log']})}\n\n"
-            
-            # Stream tokens from the model (explainer output)
-            if kind == "on_chat_model_stream":
-                chunk = event["data"]["chunk"]
-                content = chunk.content
-                if content:
-                    yield f"data: {json.dumps({'type': 'token', 'content': content})}\n\n"
+            if mode == "values":
+                state = chunk
             
-            # Notify about tool calls starting
-            elif kind == "on_tool_start":
-                tool_name = event["name"]
-                tool_input = event["data"].get("input", {})
-                logger.info(f"Tool start: {tool_name} with input {tool_input}")
-                yield f"data: {json.dumps({'type': 'tool_start', 'name': tool_name, 'input': tool_input})}\n\n"
+            # Step and tool start/end events written by the worker
+            elif mode == "custom":
+                fields = dict(chunk)
+                event_type = fields.pop("type")
+                if event_type == "step":
+                    explainer.on_step(fields)
+                    if debug:
+                        yield _emit(event_type, **fields)
+                else:
+                    logger.debug("%s: %s", event_type, fields["name"])
+                    yield _emit(event_type, **fields)
             
-            # Notify about tool calls completing
-            elif kind == "on_tool_end":
-                tool_name = event["name"]
-                tool_output = event["data"].get("output")
-                # Convert to serializable format if it's a LangChain message
-                if hasattr(tool_output, "content"):
-                    tool_output = tool_output.content
-                elif not isinstance(tool_output, (dict, list, str, int, float, bool, type(None))):
-                    tool_output = str(tool_output)
-                logger.info(f"Tool end: {tool_name}")
-                yield f"data: {json.dumps({'type': 'tool_end', 'name': tool_name, 'output': tool_output})}\n\n"
+            # Send plan and context log (debug mode) as their nodes complete
+            else:
+                planner_output = chunk.get("planner") or {}
+                worker_output = next((chunk[node] for node in WORKER_NODES if chunk.get(node)), {})
+                if planner_output.get("plan"):
+                    explainer.set_plan(planner_output["plan"])
+                    if debug:
+                        yield _emit("plan", plan=planner_output["plan"])
+                if debug and worker_output.get("context_log"):
+                    yield _emit("context_log", log=worker_output["context_log"])
+        
+        # Phase 2: stream the explainer directly from the model
+        async for content in explainer.stream(state):
+            yield _emit_token(content)
     
     except Exception as e:
-        logger.error(f"Stream error: {e}")
-        yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+        logger.error("Stream error: %s", e)
+        yield _emit("error", message=str(e))
         return
+    finally:
+        explainer.cancel()
     
     # Signal stream end
-    yield f"data: {json.dumps({'type': 'end'})}\n\n"
+    yield _emit("end")
 
 
 @app.get("/")
@@ -232,7 +270,7 @@ async def chat(request: ChatRequest):
     
     Set debug=true in request body to include plan and context_log in stream.
     """
-    logger.info(f"Chat request: {len(request.messages)} messages, provider={request.provider}, debug={request.debug}")
+    logger.info("Chat request: %d messages, provider=%s, debug=%s", len(request.messages), request.provider, request.debug)
     return StreamingResponse(
         stream_response(request.messages, provider=request.provider, debug=request.debug),
         media_type="text/event-stream",
@@ -250,7 +288,7 @@ async def chat_sync(request: ChatRequest):
     Returns the final response as JSON.
     Set debug=true to include plan and context_log in response.
     """
-    logger.info(f"Sync chat request: {len(request.messages)} messages, provider={request.provider}, debug={request.debug}")
+    logger.info("Sync chat request: %d messages, provider=%s, debug=%s", len(request.messages), request.provider, request.debug)
     
     lc_messages = convert_messages(request.messages)
     agent_graph = get_graph_with_mcp(provider=request.provider)
@@ -285,4 +323,6 @@ async def chat_sync(request: ChatRequest):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop and httptools ship with uvicorn[standard]. One process only: the
+    # plan, LLM and node caches are in-memory and aren't shared across workers.
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
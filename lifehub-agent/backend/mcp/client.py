@@ -1,25 +1,183 @@
 """MCP client for connecting to external MCP servers."""
 
 import asyncio
+import hashlib
 import logging
 import os
-from typing import Any, Callable
+import shutil
+import threading
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Optional
 
+import anyio
+import httpx
+import orjson
 from langchain_core.tools import StructuredTool
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
+from mcp.types import CONNECTION_CLOSED, Tool
+from pydantic import BaseModel, Field, create_model
+
+try:
+    from mcp.shared.exceptions import McpError
+except ImportError:  # renamed in mcp 2.x
+    from mcp.shared.exceptions import MCPError as McpError
 
 from backend.mcp.config import get_mcp_servers, MCPServerConfig
 
 logger = logging.getLogger(__name__)
 
+# Event loop that owns the pooled MCP sessions. Sync and async tool calls both
+# run their session work here, so one pool serves every caller.
+_BG_LOOP = asyncio.new_event_loop()
+threading.Thread(target=_BG_LOOP.run_forever, name="mcp-loop", daemon=True).start()
+
+# Tool catalogs discovered from MCP servers, reused across process restarts
+TOOL_CATALOG_CACHE = Path.home() / ".cache" / "lifehub" / "mcp_tools.json"
+
+
+def _catalog_key(config: MCPServerConfig) -> str:
+    """Cache key for a server's tool catalog: its command, args, and env var names."""
+    payload = orjson.dumps([config["command"], config["args"], sorted(config.get("env", {}))])
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _command_mtime(command: str) -> float | None:
+    """Modification time of the server binary, used to invalidate its cached catalog.
+    
+    None if the binary can't be found, in which case the catalog isn't cached.
+    """
+    path = shutil.which(command)
+    if path is None:
+        return None
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def _read_catalog_cache() -> dict[str, Any]:
+    try:
+        return orjson.loads(TOOL_CATALOG_CACHE.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+
+
+def _write_catalog_cache(catalog: dict[str, Any]) -> None:
+    try:
+        TOOL_CATALOG_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = TOOL_CATALOG_CACHE.with_suffix(".tmp")
+        tmp_path.write_bytes(orjson.dumps(catalog))
+        os.replace(tmp_path, TOOL_CATALOG_CACHE)
+    except OSError as e:
+        logger.warning(f"Could not write MCP tool catalog cache: {e}")
+
+
+# JSON schema types mapped to Python types, for required and optional fields
+_TYPE_MAP: dict[str, type] = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+_OPT_TYPE_MAP: dict[str, Any] = {k: Optional[v] for k, v in _TYPE_MAP.items()}
+
+# args_schema models keyed by a hash of the tool's inputSchema, so tools with
+# the same schema (and repeated initialize calls) share one model class
+_SCHEMA_CACHE: dict[str, type[BaseModel] | None] = {}
+
+
+def _build_args_schema(tool_name: str, input_schema: dict) -> type[BaseModel] | None:
+    """Build (or reuse) the pydantic model describing a tool's arguments."""
+    key = hashlib.blake2b(orjson.dumps(input_schema, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    if key in _SCHEMA_CACHE:
+        return _SCHEMA_CACHE[key]
+    
+    properties = input_schema.get("properties", {})
+    required = set(input_schema.get("required", []))
+    
+    # Build field definitions for pydantic model
+    field_definitions = {}
+    for prop_name, prop_info in properties.items():
+        prop_type = prop_info.get("type", "string")
+        prop_desc = prop_info.get("description", "")
+        
+        if prop_name in required:
+            field_definitions[prop_name] = (_TYPE_MAP.get(prop_type, str), Field(description=prop_desc))
+        else:
+            field_definitions[prop_name] = (
+                _OPT_TYPE_MAP.get(prop_type, Optional[str]),
+                Field(default=None, description=prop_desc),
+            )
+    
+    args_schema = create_model(f"{tool_name}Args", **field_definitions) if field_definitions else None
+    _SCHEMA_CACHE[key] = args_schema
+    return args_schema
+
+
+def _server_params(config: MCPServerConfig, env: dict[str, str]) -> StdioServerParameters:
+    """Build the stdio launch parameters for an MCP server."""
+    return StdioServerParameters(
+        command=config["command"],
+        args=config["args"],
+        env=env,
+    )
+
+
+@asynccontextmanager
+async def _open_session(config: MCPServerConfig, env: dict[str, str]) -> AsyncIterator[ClientSession]:
+    """Start an MCP server with environment `env` and yield an initialized session to it."""
+    async with stdio_client(_server_params(config, env)) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            yield session
+
+
+def _is_connection_error(e: BaseException) -> bool:
+    """Check if a tool call failed because the session broke, not because of the call itself.
+    
+    Errors the server reports for a call (bad arguments, unknown tool) leave
+    the session usable; a closed stream, dead process, or timed-out request
+    does not.
+    """
+    if isinstance(e, McpError):
+        return e.error.code in (CONNECTION_CLOSED, httpx.codes.REQUEST_TIMEOUT)
+    return isinstance(e, (anyio.ClosedResourceError, anyio.BrokenResourceError, anyio.EndOfStream, OSError))
+
+
+def _result_text(result: Any) -> str:
+    """Extract the text content from an MCP tool result."""
+    if result.content:
+        text_parts = []
+        for content in result.content:
+            if hasattr(content, "text"):
+                text_parts.append(content.text)
+        return "\n".join(text_parts) if text_parts else str(result)
+    
+    return str(result)
+
 
 class MCPClientManager:
-    """Manages connections to MCP servers and provides tools."""
+    """Manages connections to MCP servers and provides tools.
+    
+    Tool calls share one long-lived session per server instead of starting
+    the server for every call. The sessions live on the background loop
+    _BG_LOOP. stdio_client and ClientSession must be exited by the task that
+    entered them, so each pooled session is owned by a runner task that holds
+    it open until aclose().
+    """
     
     def __init__(self):
         self._tools: list[StructuredTool] = []
         self._initialized = False
+        # server name -> (session, close event, runner task)
+        self._sessions: dict[str, tuple[ClientSession, asyncio.Event, asyncio.Task]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        # server name -> process environment merged with the server's env, built once
+        self._server_env: dict[str, dict[str, str]] = {}
     
     async def initialize(self) -> None:
         """Initialize connections to all configured MCP servers."""
@@ -32,46 +190,82 @@ class MCPClientManager:
             self._initialized = True
             return
         
-        for server_config in servers:
-            if server_config["enabled"]:
-                try:
-                    tools = await self._connect_to_server(server_config)
-                    self._tools.extend(tools)
-                    logger.info(f"Connected to MCP server '{server_config['name']}' with {len(tools)} tools")
-                except Exception as e:
-                    logger.error(f"Failed to connect to MCP server '{server_config['name']}': {e}")
+        catalog = _read_catalog_cache()
+        enabled = [
+            (server_config, _catalog_key(server_config), _command_mtime(server_config["command"]))
+            for server_config in servers
+            if server_config["enabled"]
+        ]
+        for server_config, _, _ in enabled:
+            self._server_env[server_config["name"]] = {**os.environ, **server_config.get("env", {})}
+        
+        # Warm cache: build the tools without starting the server.
+        # Sessions are only opened when a tool is actually called.
+        server_tools: list[list[StructuredTool]] = [[] for _ in enabled]
+        to_connect = []
+        for i, (server_config, key, mtime) in enumerate(enabled):
+            cached = catalog.get(key)
+            # Without a binary to date the catalog, always ask the server
+            if mtime is not None and cached is not None and cached.get("mtime") == mtime:
+                server_tools[i] = [
+                    self._create_langchain_tool(tool_info=Tool(**info), server_config=server_config)
+                    for info in cached["tools"]
+                ]
+                logger.info(f"Loaded {len(server_tools[i])} cached tools for MCP server '{server_config['name']}'")
+            else:
+                to_connect.append(i)
+        
+        # Connections are independent, so start all cold servers at once
+        results = await asyncio.gather(
+            *(self._connect_to_server(enabled[i][0]) for i in to_connect),
+            return_exceptions=True,
+        )
+        for i, result in zip(to_connect, results):
+            server_config, key, mtime = enabled[i]
+            if isinstance(result, Exception):
+                logger.error(f"Failed to connect to MCP server '{server_config['name']}': {result}")
+                continue
+            tools, tool_infos = result
+            server_tools[i] = tools
+            logger.info(f"Connected to MCP server '{server_config['name']}' with {len(tools)} tools")
+            if mtime is not None:
+                catalog[key] = {"mtime": mtime, "tools": tool_infos}
+        
+        for tools in server_tools:
+            self._tools.extend(tools)
+        
+        if any(not isinstance(result, Exception) for result in results):
+            _write_catalog_cache(catalog)
         
         self._initialized = True
     
-    async def _connect_to_server(self, config: MCPServerConfig) -> list[StructuredTool]:
-        """Connect to an MCP server and get its tools."""
-        tools = []
+    async def _connect_to_server(self, config: MCPServerConfig) -> tuple[list[StructuredTool], list[dict]]:
+        """Connect to an MCP server and get its tools.
         
-        # Merge environment variables
-        env = {**os.environ, **config.get("env", {})}
+        Returns:
+            The LangChain tools, and the raw tool definitions for the catalog cache.
+        """
+        tools = []
+        tool_infos = []
         
-        server_params = StdioServerParameters(
-            command=config["command"],
-            args=config["args"],
-            env=env,
-        )
+        async with _open_session(config, self._server_env[config["name"]]) as session:
+            # List available tools from the server
+            tools_response = await session.list_tools()
+            
+            for tool_info in tools_response.tools:
+                # Create a LangChain-compatible tool wrapper
+                langchain_tool = self._create_langchain_tool(
+                    tool_info=tool_info,
+                    server_config=config,
+                )
+                tools.append(langchain_tool)
+                tool_infos.append({
+                    "name": tool_info.name,
+                    "description": tool_info.description,
+                    "inputSchema": tool_info.inputSchema,
+                })
         
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-                
-                # List available tools from the server
-                tools_response = await session.list_tools()
-                
-                for tool_info in tools_response.tools:
-                    # Create a LangChain-compatible tool wrapper
-                    langchain_tool = self._create_langchain_tool(
-                        tool_info=tool_info,
-                        server_config=config,
-                    )
-                    tools.append(langchain_tool)
-        
-        return tools
+        return tools, tool_infos
     
     def _create_langchain_tool(
         self,
@@ -90,27 +284,24 @@ class MCPClientManager:
         def sync_call_mcp_tool(**kwargs) -> str:
             # Filter out None values - MCP doesn't accept them
             filtered_args = {k: v for k, v in kwargs.items() if v is not None}
-            logger.info(f"MCP tool {_tool_name} sync called with args: {filtered_args}")
+            logger.info("MCP tool %s sync called with args: %s", _tool_name, filtered_args)
             
-            # Define the coroutine inside to capture args properly
-            async def _run():
-                return await _self._execute_mcp_tool(
+            # Run on the shared background loop, where the session pool lives
+            future = asyncio.run_coroutine_threadsafe(
+                _self._execute_mcp_tool(
                     server_config=_server_config,
                     tool_name=_tool_name,
                     arguments=filtered_args,
-                )
-            
-            # Run in a new thread with its own event loop to avoid conflicts
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(asyncio.run, _run())
-                return future.result(timeout=60)
+                ),
+                _BG_LOOP,
+            )
+            return future.result(timeout=60)
         
         # Async version
         async def async_call_mcp_tool(**kwargs) -> str:
             # Filter out None values - MCP doesn't accept them
             filtered_args = {k: v for k, v in kwargs.items() if v is not None}
-            logger.info(f"MCP tool {_tool_name} async called with args: {filtered_args}")
+            logger.info("MCP tool %s async called with args: %s", _tool_name, filtered_args)
             return await _self._execute_mcp_tool(
                 server_config=_server_config,
                 tool_name=_tool_name,
@@ -121,36 +312,7 @@ class MCPClientManager:
         # This tells LangChain what parameters the tool expects
         args_schema = None
         if tool_info.inputSchema:
-            from pydantic import create_model, Field
-            from typing import Optional, Any
-            
-            properties = tool_info.inputSchema.get("properties", {})
-            required = tool_info.inputSchema.get("required", [])
-            
-            # Build field definitions for pydantic model
-            field_definitions = {}
-            for prop_name, prop_info in properties.items():
-                prop_type = prop_info.get("type", "string")
-                prop_desc = prop_info.get("description", "")
-                
-                # Map JSON schema types to Python types
-                type_map = {
-                    "string": str,
-                    "integer": int,
-                    "number": float,
-                    "boolean": bool,
-                    "array": list,
-                    "object": dict,
-                }
-                python_type = type_map.get(prop_type, str)
-                
-                if prop_name in required:
-                    field_definitions[prop_name] = (python_type, Field(description=prop_desc))
-                else:
-                    field_definitions[prop_name] = (Optional[python_type], Field(default=None, description=prop_desc))
-            
-            if field_definitions:
-                args_schema = create_model(f"{tool_info.name}Args", **field_definitions)
+            args_schema = _build_args_schema(tool_info.name, tool_info.inputSchema)
         
         return StructuredTool.from_function(
             func=sync_call_mcp_tool,
@@ -167,32 +329,88 @@ class MCPClientManager:
         arguments: dict[str, Any],
     ) -> str:
         """Execute an MCP tool and return the result."""
-        logger.info(f"Executing MCP tool '{tool_name}' with arguments: {arguments}")
+        # Pooled sessions can only be used from the loop they were opened on
+        if asyncio.get_running_loop() is not _BG_LOOP:
+            future = asyncio.run_coroutine_threadsafe(
+                self._execute_mcp_tool(server_config, tool_name, arguments), _BG_LOOP
+            )
+            return await asyncio.wrap_future(future)
         
-        env = {**os.environ, **server_config.get("env", {})}
+        logger.info("Executing MCP tool '%s' with arguments: %s", tool_name, arguments)
         
-        server_params = StdioServerParameters(
-            command=server_config["command"],
-            args=server_config["args"],
-            env=env,
-        )
+        server_name = server_config["name"]
+        lock = self._locks.get(server_name)
+        if lock is None:
+            lock = self._locks[server_name] = asyncio.Lock()
+        async with lock:
+            session = await self._get_or_open_session(server_config)
         
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-                
-                # Pass arguments directly - MCP expects them as a dict
-                result = await session.call_tool(tool_name, arguments=arguments)
-                
-                # Extract text content from result
-                if result.content:
-                    text_parts = []
-                    for content in result.content:
-                        if hasattr(content, "text"):
-                            text_parts.append(content.text)
-                    return "\n".join(text_parts) if text_parts else str(result)
-                
-                return str(result)
+        try:
+            # Pass arguments directly - MCP expects them as a dict
+            result = await session.call_tool(tool_name, arguments=arguments)
+        except Exception as e:
+            # Only a broken connection needs a new server; a failed call doesn't
+            if _is_connection_error(e):
+                await self._close_session(server_name)
+            raise
+        
+        return _result_text(result)
+    
+    async def _get_or_open_session(self, config: MCPServerConfig) -> ClientSession:
+        """Get the pooled session for a server, starting the server if needed.
+        
+        Must be called with the server's lock held.
+        """
+        pooled = self._sessions.get(config["name"])
+        if pooled is not None and not pooled[2].done():
+            return pooled[0]
+        
+        ready: asyncio.Future[ClientSession] = _BG_LOOP.create_future()
+        closing = asyncio.Event()
+        task = asyncio.create_task(self._run_session(config, ready, closing))
+        session = await ready
+        self._sessions[config["name"]] = (session, closing, task)
+        logger.info(f"Opened pooled session to MCP server '{config['name']}'")
+        return session
+    
+    async def _run_session(
+        self,
+        config: MCPServerConfig,
+        ready: asyncio.Future,
+        closing: asyncio.Event,
+    ) -> None:
+        """Hold a session open until `closing` is set."""
+        try:
+            async with _open_session(config, self._server_env[config["name"]]) as session:
+                ready.set_result(session)
+                await closing.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning(f"MCP session to '{config['name']}' closed with error: {e}")
+        finally:
+            # Cancelled before the session was up - don't leave the opener waiting
+            if not ready.done():
+                ready.set_exception(RuntimeError(f"MCP session to '{config['name']}' was cancelled while opening"))
+    
+    async def _close_session(self, server_name: str) -> None:
+        """Close a server's pooled session, if it has one."""
+        pooled = self._sessions.pop(server_name, None)
+        if pooled is None:
+            return
+        _, closing, task = pooled
+        closing.set()
+        await asyncio.gather(task, return_exceptions=True)
+    
+    async def aclose(self) -> None:
+        """Close all pooled sessions and stop their servers."""
+        if asyncio.get_running_loop() is not _BG_LOOP:
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(self.aclose(), _BG_LOOP))
+            return
+        
+        for server_name in list(self._sessions):
+            await self._close_session(server_name)
     
     def get_tools(self) -> list[StructuredTool]:
         """Get all available MCP tools."""
@@ -218,15 +436,20 @@ async def get_mcp_tools() -> list[StructuredTool]:
     return _mcp_manager.get_tools()
 
 
+async def close_mcp_sessions() -> None:
+    """Close pooled MCP sessions. Call on application shutdown."""
+    if _mcp_manager is not None:
+        await _mcp_manager.aclose()
+
+
 def get_mcp_tools_sync() -> list[StructuredTool]:
     """Synchronous version of get_mcp_tools."""
     try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # If we're already in an async context, return empty
-            # Tools will be loaded async later
-            return []
-        return loop.run_until_complete(get_mcp_tools())
+        asyncio.get_running_loop()
     except RuntimeError:
-        # No event loop, create one
-        return asyncio.run(get_mcp_tools())
+        # Not in an async context - load on the shared background loop
+        return asyncio.run_coroutine_threadsafe(get_mcp_tools(), _BG_LOOP).result(timeout=60)
+    
+    # If we're already in an async context, return empty
+    # Tools will be loaded async later
+    return []
@@ -1,6 +1,7 @@
 """MCP server configuration."""
 
 import os
+from functools import lru_cache
 from typing import TypedDict
 
 
@@ -13,10 +14,12 @@ class MCPServerConfig(TypedDict):
     enabled: bool
 
 
+@lru_cache(maxsize=1)
 def get_mcp_servers() -> list[MCPServerConfig]:
     """Get list of configured MCP servers.
     
-    Returns servers that are enabled based on environment variables.
+    Returns servers that are enabled based on environment variables. The
+    environment is read once; call reset_mcp_config_cache() after changing it.
     """
     servers: list[MCPServerConfig] = []
     
@@ -36,4 +39,9 @@ def get_mcp_servers() -> list[MCPServerConfig]:
 
 def is_mcp_enabled() -> bool:
     """Check if MCP is enabled (any servers configured)."""
-    return len(get_mcp_servers()) > 0
+    return bool(get_mcp_servers())
+
+
+def reset_mcp_config_cache() -> None:
+    """Forget the cached server list so the environment is read again."""
+    get_mcp_servers.cache_clear()
@@ -1,14 +1,34 @@
 """Model clients for OpenAI and Ollama via OpenAI-compatible API."""
 
+import asyncio
+import logging
+from functools import lru_cache
+
+import httpx
 from langchain_openai import ChatOpenAI
 
+logger = logging.getLogger(__name__)
+
+OPENAI_BASE_URL = "https://api.openai.com/v1"
+OLLAMA_BASE_URL = "http://localhost:11434/v1"
+
+# Shared connection pools for every model client, so planner/worker/explainer
+# (and every provider) reuse keep-alive HTTP/2 connections instead of each
+# ChatOpenAI opening its own pool
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=100, max_connections=200)
+_HTTP_TIMEOUT = httpx.Timeout(30.0, connect=3.0)
+
+http_client = httpx.Client(http2=True, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+http_async_client = httpx.AsyncClient(http2=True, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
 
+
+@lru_cache(maxsize=8)
 def get_openai_client(
     model: str = "gpt-4o-mini",
     temperature: float = 0.7,
     streaming: bool = True,
 ) -> ChatOpenAI:
-    """Get OpenAI client.
+    """Get OpenAI client, cached per configuration.
     
     Requires OPENAI_API_KEY environment variable to be set.
     """
@@ -16,22 +36,27 @@ def get_openai_client(
         model=model,
         temperature=temperature,
         streaming=streaming,
+        http_client=http_client,
+        http_async_client=http_async_client,
     )
 
 
+@lru_cache(maxsize=8)
 def get_ollama_client(
     model: str = "llama3.2",
     temperature: float = 0.7,
     streaming: bool = True,
-    base_url: str = "http://localhost:11434/v1",
+    base_url: str = OLLAMA_BASE_URL,
 ) -> ChatOpenAI:
-    """Get Ollama client via OpenAI-compatible API."""
+    """Get Ollama client via OpenAI-compatible API, cached per configuration."""
     return ChatOpenAI(
         model=model,
         temperature=temperature,
         streaming=streaming,
         base_url=base_url,
         api_key="ollama",  # Ollama doesn't require a real API key
+        http_client=http_client,
+        http_async_client=http_async_client,
     )
 
 
@@ -57,3 +82,34 @@ def get_model_client(
         temperature=temperature,
         streaming=streaming,
     )
+
+
+def clear_model_cache() -> None:
+    """Drop cached model clients, e.g. after changing API keys or model config."""
+    get_openai_client.cache_clear()
+    get_ollama_client.cache_clear()
+
+
+async def prewarm_connections() -> None:
+    """Open pooled connections to the model endpoints before the first request.
+    
+    Pays DNS + TCP + TLS setup at startup instead of on a user's first call.
+    Unreachable endpoints (e.g. no local Ollama) are ignored.
+    """
+    async def _head_async(url: str) -> None:
+        try:
+            await http_async_client.head(url)
+        except httpx.HTTPError as e:
+            logger.info(f"Connection prewarm skipped for {url}: {e}")
+    
+    def _head_sync(url: str) -> None:
+        try:
+            http_client.head(url)
+        except httpx.HTTPError as e:
+            logger.info(f"Connection prewarm skipped for {url}: {e}")
+    
+    urls = (OPENAI_BASE_URL, OLLAMA_BASE_URL)
+    await asyncio.gather(
+        *(_head_async(url) for url in urls),
+        *(asyncio.to_thread(_head_sync, url) for url in urls),
+    )
@@ -1,9 +1,12 @@
 """Embeddings module - supports OpenAI and Ollama embedding models."""
 
+import asyncio
 import os
+from functools import lru_cache
 from typing import Literal
 
 import httpx
+import numpy as np
 from openai import OpenAI
 
 # Embedding provider type
@@ -13,6 +16,9 @@ EmbeddingProvider = Literal["openai", "ollama"]
 OPENAI_EMBEDDING_MODEL = "text-embedding-3-small"
 OLLAMA_EMBEDDING_MODEL = "nomic-embed-text"  # Run: ollama pull nomic-embed-text
 
+# Most inputs OpenAI accepts in one embeddings request
+OPENAI_EMBEDDING_BATCH_SIZE = 2048
+
 # Ollama base URL
 OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
 
@@ -25,38 +31,75 @@ def get_embedding_provider() -> EmbeddingProvider:
     return "openai"
 
 
-def get_embeddings_openai(texts: list[str]) -> list[list[float]]:
-    """Get embeddings using OpenAI API."""
+@lru_cache(maxsize=1)
+def _openai_client() -> OpenAI:
+    """Get the shared OpenAI client, so its connection pool is reused."""
     api_key = os.environ.get("OPENAI_API_KEY")
     if not api_key:
         raise ValueError("OPENAI_API_KEY environment variable is required")
     
-    client = OpenAI(api_key=api_key)
-    response = client.embeddings.create(
-        model=OPENAI_EMBEDDING_MODEL,
-        input=texts,
-    )
-    return [item.embedding for item in response.data]
+    return OpenAI(api_key=api_key)
 
 
-def get_embeddings_ollama(texts: list[str]) -> list[list[float]]:
-    """Get embeddings using Ollama API."""
-    embeddings = []
+def get_embeddings_openai(texts: list[str]) -> np.ndarray:
+    """Get embeddings using OpenAI API, in requests of at most OPENAI_EMBEDDING_BATCH_SIZE texts."""
+    client = _openai_client()
+    embeddings: np.ndarray | None = None
     
-    for text in texts:
-        response = httpx.post(
-            f"{OLLAMA_BASE_URL}/api/embeddings",
-            json={"model": OLLAMA_EMBEDDING_MODEL, "prompt": text},
-            timeout=60.0,
+    for i in range(0, len(texts), OPENAI_EMBEDDING_BATCH_SIZE):
+        response = client.embeddings.create(
+            model=OPENAI_EMBEDDING_MODEL,
+            input=texts[i:i + OPENAI_EMBEDDING_BATCH_SIZE],
         )
-        response.raise_for_status()
-        data = response.json()
-        embeddings.append(data["embedding"])
+        if embeddings is None:
+            # Rows are written straight into one float32 matrix
+            embeddings = np.empty((len(texts), len(response.data[0].embedding)), dtype=np.float32)
+        for j, item in enumerate(response.data):
+            embeddings[i + j] = item.embedding
     
     return embeddings
 
 
-def get_embeddings(texts: list[str], provider: EmbeddingProvider | None = None) -> list[list[float]]:
+async def _get_embeddings_ollama_legacy(texts: list[str]) -> list[list[float]]:
+    """Get embeddings from an Ollama server without /api/embed, one concurrent request per text."""
+    async with httpx.AsyncClient(
+        base_url=OLLAMA_BASE_URL,
+        timeout=60.0,
+        limits=httpx.Limits(max_keepalive_connections=16),
+    ) as client:
+        async def _fetch(text: str) -> list[float]:
+            response = await client.post(
+                "/api/embeddings",
+                json={"model": OLLAMA_EMBEDDING_MODEL, "prompt": text},
+            )
+            response.raise_for_status()
+            return response.json()["embedding"]
+        
+        return await asyncio.gather(*(_fetch(text) for text in texts))
+
+
+def get_embeddings_ollama(texts: list[str]) -> np.ndarray:
+    """Get embeddings using Ollama API.
+    
+    Embeds all texts in one /api/embed request. Servers older than that
+    endpoint get one request per text, sent concurrently. Must not be called
+    from a running event loop.
+    """
+    response = httpx.post(
+        f"{OLLAMA_BASE_URL}/api/embed",
+        json={"model": OLLAMA_EMBEDDING_MODEL, "input": texts},
+        timeout=60.0,
+    )
+    if response.status_code == 404:
+        embeddings = asyncio.run(_get_embeddings_ollama_legacy(texts))
+    else:
+        response.raise_for_status()
+        embeddings = response.json()["embeddings"]
+    
+    return np.asarray(embeddings, dtype=np.float32)
+
+
+def get_embeddings(texts: list[str], provider: EmbeddingProvider | None = None) -> np.ndarray:
     """Get embeddings for a list of texts.
     
     Args:
@@ -64,10 +107,10 @@ def get_embeddings(texts: list[str], provider: EmbeddingProvider | None = None)
         provider: Embedding provider to use. If None, uses EMBEDDING_PROVIDER env var.
         
     Returns:
-        List of embedding vectors.
+        A float32 array with one embedding vector per row.
     """
     if not texts:
-        return []
+        return np.empty((0, 0), dtype=np.float32)
     
     if provider is None:
         provider = get_embedding_provider()
@@ -78,7 +121,7 @@ def get_embeddings(texts: list[str], provider: EmbeddingProvider | None = None)
         return get_embeddings_openai(texts)
 
 
-def get_single_embedding(text: str, provider: EmbeddingProvider | None = None) -> list[float]:
+def get_single_embedding(text: str, provider: EmbeddingProvider | None = None) -> np.ndarray:
     """Get embedding for a single text.
     
     Args:
@@ -89,4 +132,4 @@ def get_single_embedding(text: str, provider: EmbeddingProvider | None = None) -
         Embedding vector.
     """
     embeddings = get_embeddings([text], provider)
-    return embeddings[0] if embeddings else []
+    return embeddings[0] if len(embeddings) else np.empty(0, dtype=np.float32)
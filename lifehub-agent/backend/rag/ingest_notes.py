@@ -7,6 +7,8 @@ Usage:
     EMBEDDING_PROVIDER=ollama python -m backend.rag.ingest_notes
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from backend.rag.embeddings import get_embeddings, get_embedding_provider
@@ -19,6 +21,9 @@ NOTES_DIR = Path(__file__).parent.parent / "notes"
 CHUNK_SIZE = 500  # characters
 CHUNK_OVERLAP = 50  # characters
 
+# Chunks embedded and upserted together, bounding peak memory
+UPSERT_BATCH_SIZE = 256
+
 
 def chunk_text(text: str, chunk_size: int = CHUNK_SIZE, overlap: int = CHUNK_OVERLAP) -> list[str]:
     """Split text into overlapping chunks.
@@ -31,30 +36,24 @@ def chunk_text(text: str, chunk_size: int = CHUNK_SIZE, overlap: int = CHUNK_OVE
     Returns:
         List of text chunks.
     """
-    if len(text) <= chunk_size:
-        return [text.strip()] if text.strip() else []
-    
-    chunks = []
-    start = 0
-    
-    while start < len(text):
-        end = start + chunk_size
-        chunk = text[start:end].strip()
-        
-        if chunk:
-            chunks.append(chunk)
-        
-        start = end - overlap
-        
-        # Avoid infinite loop on very small texts
-        if start >= len(text) - overlap:
-            break
-    
-    return chunks
+    # Chunks start every (chunk_size - overlap) characters; the last one is the
+    # first that reaches within `overlap` of the end
+    step = chunk_size - overlap
+    starts = range(0, max(len(text) - overlap, 1), step)
+    chunks = [text[start:start + chunk_size].strip() for start in starts]
+    return [chunk for chunk in chunks if chunk]
 
 
 
 
+def _read_note(path: str) -> tuple[str, str | Exception]:
+    """Read a note file, returning the error instead of raising it."""
+    try:
+        return os.path.basename(path), Path(path).read_text(encoding="utf-8")
+    except Exception as e:
+        return os.path.basename(path), e
+
+
 def scan_notes_directory() -> list[tuple[str, str]]:
     """Scan the notes directory for .md and .txt files.
     
@@ -67,14 +66,22 @@ def scan_notes_directory() -> list[tuple[str, str]]:
         print(f"Notes directory not found: {NOTES_DIR}")
         return notes
     
-    for file_path in NOTES_DIR.iterdir():
-        if file_path.suffix.lower() in [".md", ".txt"]:
-            try:
-                content = file_path.read_text(encoding="utf-8")
-                notes.append((file_path.name, content))
-                print(f"  Found: {file_path.name} ({len(content)} chars)")
-            except Exception as e:
-                print(f"  Error reading {file_path.name}: {e}")
+    with os.scandir(NOTES_DIR) as entries:
+        targets = [e.path for e in entries if e.is_file() and e.name.lower().endswith((".md", ".txt"))]
+    
+    if not targets:
+        return notes
+    
+    # Overlap the file reads; results are reported here, not from the workers
+    with ThreadPoolExecutor(max_workers=min(16, len(targets))) as executor:
+        results = list(executor.map(_read_note, targets))
+    
+    for filename, content in results:
+        if isinstance(content, Exception):
+            print(f"  Error reading {filename}: {content}")
+            continue
+        notes.append((filename, content))
+        print(f"  Found: {filename} ({len(content)} chars)")
     
     return notes
 
@@ -96,10 +103,10 @@ def ingest_notes() -> None:
     print("\n[2/5] Clearing existing collection...")
     existing_count = collection.count()
     if existing_count > 0:
-        # Get all IDs and delete them
-        all_ids = collection.get()["ids"]
-        if all_ids:
-            collection.delete(ids=all_ids)
+        # Dropping the collection is one metadata operation, unlike fetching
+        # and deleting every ID
+        chroma_client.delete_collection(collection.name)
+        collection = get_notes_collection(chroma_client)
         print(f"  Deleted {existing_count} existing documents")
     
     # Scan notes directory
@@ -137,18 +144,18 @@ def ingest_notes() -> None:
     
     print(f"  Total chunks: {len(all_chunks)}")
     
-    # Generate embeddings
+    # Generate embeddings and upsert into ChromaDB, one batch at a time
     print("\n[5/5] Generating embeddings and storing...")
-    embeddings = get_embeddings(all_chunks)
-    print(f"  Generated {len(embeddings)} embeddings")
-    
-    # Upsert into ChromaDB
-    collection.upsert(
-        ids=all_ids,
-        documents=all_chunks,
-        embeddings=embeddings,
-        metadatas=all_metadatas,
-    )
+    for i in range(0, len(all_chunks), UPSERT_BATCH_SIZE):
+        batch = slice(i, i + UPSERT_BATCH_SIZE)
+        embeddings = get_embeddings(all_chunks[batch])
+        collection.upsert(
+            ids=all_ids[batch],
+            documents=all_chunks[batch],
+            embeddings=embeddings,
+            metadatas=all_metadatas[batch],
+        )
+        print(f"  Stored chunks {i + 1}-{i + len(embeddings)}")
     
     print(f"  Stored {len(all_chunks)} chunks in ChromaDB")
     
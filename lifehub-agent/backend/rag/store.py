@@ -1,5 +1,6 @@
 """ChromaDB vector store setup for notes collection."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -10,8 +11,9 @@ from chromadb.config import Settings
 CHROMA_PERSIST_DIR = Path(__file__).parent.parent / "state" / "chroma"
 
 
+@lru_cache(maxsize=1)
 def get_chroma_client() -> Any:
-    """Get or create a persistent ChromaDB client.
+    """Get or create the shared persistent ChromaDB client.
     
     Returns:
         A ChromaDB PersistentClient instance.
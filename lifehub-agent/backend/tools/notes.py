@@ -1,11 +1,64 @@
 """Notes search tool - searches personal notes using RAG."""
 
+import threading
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+from chromadb.errors import NotFoundError
 from langchain_core.tools import tool
 
-from backend.rag.embeddings import get_single_embedding
+from backend.rag.embeddings import EmbeddingProvider, get_embedding_provider, get_single_embedding
 from backend.rag.store import get_notes_collection
 
 
+# Notes collection, opened on first search
+_COLLECTION: Any = None
+_LOCK = threading.Lock()
+
+
+def _collection() -> Any:
+    """Get the notes collection, opening it once per process."""
+    global _COLLECTION
+    if _COLLECTION is None:
+        with _LOCK:
+            if _COLLECTION is None:
+                _COLLECTION = get_notes_collection()
+    return _COLLECTION
+
+
+def _reset_collection() -> None:
+    """Forget the open collection so the next _collection() call reopens it."""
+    global _COLLECTION
+    with _LOCK:
+        _COLLECTION = None
+
+
+def _query(query_embedding: np.ndarray, top_k: int) -> dict:
+    """Query the notes collection, reopening it once if it was recreated."""
+    kwargs = {
+        "query_embeddings": [query_embedding],
+        "n_results": top_k,
+        "include": ["documents", "metadatas", "distances"],
+    }
+    try:
+        return _collection().query(**kwargs)
+    except NotFoundError:
+        # Re-ingesting deletes and recreates the collection, which
+        # invalidates the handle we opened earlier
+        _reset_collection()
+        return _collection().query(**kwargs)
+
+
+@lru_cache(maxsize=512)
+def _cached_query_embedding(query: str, provider: EmbeddingProvider) -> np.ndarray:
+    """Embed a search query, reusing the vector for repeated queries."""
+    embedding = get_single_embedding(query, provider)
+    # Shared between callers, so make sure nobody modifies it in place
+    embedding.flags.writeable = False
+    return embedding
+
+
 @tool
 def search_notes(query: str, top_k: int = 5) -> list[dict]:
     """Search personal notes for relevant information.
@@ -21,48 +74,32 @@ def search_notes(query: str, top_k: int = 5) -> list[dict]:
         A list of relevant note chunks with content, source filename, and relevance score.
     """
     try:
-        # Get the notes collection
-        collection = get_notes_collection()
-        
-        # Check if collection has any documents
-        if collection.count() == 0:
-            return [{
-                "content": "No notes have been indexed yet. Please run the ingestion script first.",
-                "source": "system",
-                "score": 0.0,
-            }]
-        
         # Get query embedding
-        query_embedding = get_single_embedding(query)
+        query_embedding = _cached_query_embedding(query, get_embedding_provider())
         
-        # Search the collection
-        results = collection.query(
-            query_embeddings=[query_embedding],
-            n_results=min(top_k, collection.count()),
-            include=["documents", "metadatas", "distances"],
-        )
+        # Search the collection (returns fewer than top_k if it holds fewer)
+        results = _query(query_embedding, top_k)
         
         # Format results
-        formatted_results = []
+        docs = results["documents"][0] if results["documents"] else []
+        metas = results["metadatas"][0] if results["metadatas"] else [{}] * len(docs)
+        dists = results["distances"][0] if results["distances"] else [0.0] * len(docs)
         
-        if results["documents"] and results["documents"][0]:
-            for i, doc in enumerate(results["documents"][0]):
-                metadata = results["metadatas"][0][i] if results["metadatas"] else {}
-                distance = results["distances"][0][i] if results["distances"] else 0.0
-                
-                # Convert distance to similarity score (ChromaDB uses L2 distance by default)
-                # Lower distance = more similar, so we invert it
-                score = 1.0 / (1.0 + distance)
-                
-                formatted_results.append({
-                    "content": doc,
-                    "source": metadata.get("source", "unknown"),
-                    "score": round(score, 4),
-                })
+        # Convert distance to similarity score (ChromaDB uses L2 distance by default)
+        # Lower distance = more similar, so we invert it
+        formatted_results = [
+            {
+                "content": doc,
+                "source": (metadata or {}).get("source", "unknown"),
+                "score": round(1.0 / (1.0 + distance), 4),
+            }
+            for doc, metadata, distance in zip(docs, metas, dists)
+        ]
         
+        # Nearest-neighbour search only comes back empty for an empty collection
         if not formatted_results:
             return [{
-                "content": "No relevant notes found for your query.",
+                "content": "No notes have been indexed yet. Please run the ingestion script first.",
                 "source": "system",
                 "score": 0.0,
             }]
@@ -70,6 +107,8 @@ def search_notes(query: str, top_k: int = 5) -> list[dict]:
         return formatted_results
         
     except Exception as e:
+        # Reopen the collection on the next search in case the handle is bad
+        _reset_collection()
         return [{
             "content": f"Error searching notes: {str(e)}",
             "source": "error",
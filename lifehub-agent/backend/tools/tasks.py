@@ -1,8 +1,8 @@
 """Tasks tool - manages tasks in a local JSON file."""
 
-import json
 from pathlib import Path
 
+import orjson
 from langchain_core.tools import tool
 
 # Path to tasks.json in the state directory
@@ -14,17 +14,15 @@ def _load_tasks() -> list[dict]:
     if not TASKS_FILE.exists():
         return []
     try:
-        with open(TASKS_FILE, "r") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
+        return orjson.loads(TASKS_FILE.read_bytes())
+    except (orjson.JSONDecodeError, IOError):
         return []
 
 
 def _save_tasks(tasks: list[dict]) -> None:
     """Save tasks to JSON file."""
     TASKS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(TASKS_FILE, "w") as f:
-        json.dump(tasks, f, indent=2)
+    TASKS_FILE.write_bytes(orjson.dumps(tasks, option=orjson.OPT_INDENT_2))
 
 
 @tool
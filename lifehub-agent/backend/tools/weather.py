@@ -1,10 +1,66 @@
-"""Weather tool - fetches real weather data from Open-Meteo API (free, no API key required)."""
+"""Weather tool - fetches real weather data from Open-Meteo API (free, no API key required).
+
+Set LIFEHUB_WEATHER_STUB=1 to return fixed data without any network calls
+(for tests and offline development).
+"""
+
+import asyncio
+import atexit
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, NamedTuple
+from urllib.parse import quote_plus
 
 import httpx
-from langchain_core.tools import tool
+import orjson
+from langchain_core.tools import StructuredTool
+
+logger = logging.getLogger(__name__)
+
+GEOCODING_HOST = "https://geocoding-api.open-meteo.com"
+WEATHER_HOST = "https://api.open-meteo.com"
+
+# One keep-alive pool per host, so repeated lookups skip the TCP/TLS handshake
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+# Ask for gzip explicitly - httpx's default list depends on which optional
+# decoders happen to be installed, and Open-Meteo's JSON shrinks well with gzip
+_HTTP_HEADERS = {"Accept-Encoding": "gzip"}
+
+_GEO_CLIENT = httpx.Client(base_url=GEOCODING_HOST, headers=_HTTP_HEADERS, limits=_HTTP_LIMITS, timeout=10.0, http2=True)
+_WX_CLIENT = httpx.Client(base_url=WEATHER_HOST, headers=_HTTP_HEADERS, limits=_HTTP_LIMITS, timeout=10.0, http2=True)
+atexit.register(_GEO_CLIENT.close)
+atexit.register(_WX_CLIENT.close)
+
+# Runs a city's geocoding queries in parallel on the sync path
+_GEO_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="geocode")
+
+# Async counterparts, used when the tool is awaited from the agent graph
+_ASYNC_GEO_CLIENT = httpx.AsyncClient(base_url=GEOCODING_HOST, headers=_HTTP_HEADERS, limits=_HTTP_LIMITS, timeout=10.0, http2=True)
+_ASYNC_WX_CLIENT = httpx.AsyncClient(base_url=WEATHER_HOST, headers=_HTTP_HEADERS, limits=_HTTP_LIMITS, timeout=10.0, http2=True)
+
+# Geocoding results hardly ever change, so they are kept for 30 days
+GEOCODE_CACHE_MAX_SIZE = 1024
+GEOCODE_CACHE_TTL = 30 * 24 * 60 * 60
+
+# On-disk geocode cache, so warm entries survive restarts (rows expire after 90 days)
+GEOCODE_DB = Path.home() / ".cache" / "lifehub" / "geo.sqlite"
+GEOCODE_DB_TTL = 90 * 24 * 60 * 60
+
+# Current conditions only update every ~10 minutes
+WEATHER_CACHE_MAX_SIZE = 512
+WEATHER_CACHE_TTL = 600
 
-GEOCODING_URL = "https://geocoding-api.open-meteo.com/v1/search"
-WEATHER_URL = "https://api.open-meteo.com/v1/forecast"
+TEMPERATURE_UNIT = "fahrenheit"
+WIND_SPEED_UNIT = "mph"
 
 # Weather code descriptions from Open-Meteo
 WEATHER_CODES = {
@@ -34,40 +90,379 @@ WEATHER_CODES = {
     99: "thunderstorm with heavy hail",
 }
 
+# WEATHER_CODES as a tuple indexed by code, so lookups are a plain index
+_WX_DESC = tuple(WEATHER_CODES.get(code, "unknown") for code in range(100))
+
+
+class Weather(NamedTuple):
+    """Current weather for a city - get_weather returns it as a dict via _asdict()."""
+
+    city: str
+    country: str
+    temp: str
+    feels_like: str
+    humidity: str
+    conditions: str
+    wind_speed: str
+
+
+# Weather fields that come from the forecast (everything but city and country)
+Conditions = tuple[str, str, str, str, str]
+
+
+def is_weather_stub_enabled() -> bool:
+    """Check if the offline weather stub is enabled via LIFEHUB_WEATHER_STUB."""
+    return os.getenv("LIFEHUB_WEATHER_STUB", "").lower() in ("1", "true", "yes")
+
+
+def _stub_weather(city: str) -> dict:
+    """Fixed weather in the same shape as a real result."""
+    return Weather(city, "", "72°F", "72°F", "50%", "clear sky", "5.0 mph")._asdict()
+
+
+class _TTLCache:
+    """Thread-safe LRU cache whose entries expire after `ttl` seconds."""
+
+    def __init__(self, max_size: int, ttl: float):
+        self._max_size = max_size
+        self._ttl = ttl
+        self._data: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self._ttl, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self._max_size:
+                self._data.popitem(last=False)
+
+
+_GEO_CACHE = _TTLCache(GEOCODE_CACHE_MAX_SIZE, GEOCODE_CACHE_TTL)
+_WX_CACHE = _TTLCache(WEATHER_CACHE_MAX_SIZE, WEATHER_CACHE_TTL)
+
+
+_GEO_DB_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _geo_db() -> sqlite3.Connection | None:
+    """Open the on-disk geocode cache and drop expired rows, or None if it can't be opened."""
+    try:
+        GEOCODE_DB.parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(GEOCODE_DB, check_same_thread=False, isolation_level=None)
+        # WAL lets other processes read while one writes; NORMAL skips the
+        # per-commit fsync, which is fine for a cache
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS geocode "
+            "(key TEXT PRIMARY KEY, lat REAL, lon REAL, name TEXT, country TEXT, ts INTEGER)"
+        )
+        db.execute("DELETE FROM geocode WHERE ts < ?", (int(time.time()) - GEOCODE_DB_TTL,))
+        return db
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"Geocode disk cache unavailable: {e}")
+        return None
+
+
+# A city name needs at least one letter (in any script) and is never this long
+_CITY_RE = re.compile(r"[^\W\d_]")
+CITY_MAX_LENGTH = 128
+
+
+def _is_plausible_city(city: str) -> bool:
+    """Reject empty, punctuation-only, or overlong input before any lookup."""
+    return 0 < len(city) <= CITY_MAX_LENGTH and _CITY_RE.search(city) is not None
+
+
+def _geocode_key(city: str) -> str:
+    return city.strip().lower()
+
+
+def _cached_coordinates(key: str) -> tuple[float, float, str, str] | None:
+    """Look up a geocode in memory, then on disk."""
+    coords = _GEO_CACHE.get(key)
+    if coords is not None:
+        return coords
+
+    db = _geo_db()
+    if db is None:
+        return None
+    try:
+        with _GEO_DB_LOCK:
+            row = db.execute(
+                "SELECT lat, lon, name, country FROM geocode WHERE key = ? AND ts >= ?",
+                (key, int(time.time()) - GEOCODE_DB_TTL),
+            ).fetchone()
+    except sqlite3.Error as e:
+        logger.warning(f"Geocode disk cache read failed: {e}")
+        return None
+
+    if row is not None:
+        coords = tuple(row)
+        _GEO_CACHE.set(key, coords)
+    return coords
+
+
+def _cache_coordinates(key: str, coords: tuple[float, float, str, str]) -> None:
+    """Store a geocode in memory and on disk."""
+    _GEO_CACHE.set(key, coords)
+
+    db = _geo_db()
+    if db is None:
+        return
+    try:
+        with _GEO_DB_LOCK:
+            db.execute(
+                "INSERT OR REPLACE INTO geocode VALUES (?, ?, ?, ?, ?, ?)",
+                (key, *coords, int(time.time())),
+            )
+    except sqlite3.Error as e:
+        logger.warning(f"Geocode disk cache write failed: {e}")
+
+
+def _geocode_queries(city: str) -> list[str]:
+    """Queries to try for a city: the full string, then just the name before a comma."""
+    queries = [city]
+    if "," in city:
+        queries.append(city.split(",")[0].strip())
+    return queries
+
+
+# Constant parts of the request URLs, encoded once instead of on every call.
+# Only the top geocoding match is used, so don't download the other candidates.
+_GEO_STATIC = "/v1/search?count=1&language=en&format=json"
+_WX_UNITS = f"&temperature_unit={TEMPERATURE_UNIT}&wind_speed_unit={WIND_SPEED_UNIT}&timezone=auto"
+
+# `current` variables requested by each tool
+WEATHER_FIELDS = ("temperature_2m", "relative_humidity_2m", "apparent_temperature", "weather_code", "wind_speed_10m")
+TEMPERATURE_FIELDS = ("temperature_2m",)
+
+
+def _geocode_url(query: str) -> str:
+    return f"{_GEO_STATIC}&name={quote_plus(query)}"
+
+
+def _parse_coordinates(data: dict, city: str) -> tuple[float, float, str, str] | None:
+    """Pull (lat, lon, name, country) out of a geocoding response."""
+    if not data.get("results"):
+        return None
+    result = data["results"][0]
+    return (
+        result["latitude"],
+        result["longitude"],
+        result.get("name", city),
+        result.get("country", ""),
+    )
+
+
+def _coordinates_from_response(response: httpx.Response, city: str) -> tuple[float, float, str, str] | None:
+    """Parse a geocoding response, treating an error status or bad JSON as a miss."""
+    if response.status_code >= 400:
+        return None
+    try:
+        data = orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        return None
+    return _parse_coordinates(data, city)
+
+
+@lru_cache(maxsize=None)
+def _forecast_static(fields: tuple[str, ...]) -> str:
+    """Constant part of a forecast URL for a set of `current` variables."""
+    return f"/v1/forecast?current={','.join(fields)}{_WX_UNITS}"
+
+
+def _forecast_url(lat: float | str, lon: float | str, fields: tuple[str, ...]) -> str:
+    # lat/lon may be comma-separated lists to fetch several locations at once
+    return f"{_forecast_static(fields)}&latitude={lat}&longitude={lon}"
+
+
+def _fetch_forecast(lat: float | str, lon: float | str, fields: tuple[str, ...]) -> dict | list:
+    """Fetch the given current variables for one or more locations."""
+    response = _WX_CLIENT.get(_forecast_url(lat, lon, fields))
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+
+async def _afetch_forecast(lat: float | str, lon: float | str, fields: tuple[str, ...]) -> dict | list:
+    """Async _fetch_forecast."""
+    response = await _ASYNC_WX_CLIENT.get(_forecast_url(lat, lon, fields))
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+
+def _weather_key(lat: float, lon: float) -> tuple:
+    """Cache key for a location's current weather (~1 km grid, plus units)."""
+    return (round(lat, 2), round(lon, 2), TEMPERATURE_UNIT, WIND_SPEED_UNIT)
+
+
+def _parse_weather(data: dict) -> Conditions:
+    """Pull the current conditions out of a forecast response."""
+    current = data.get("current", {})
+    weather_code = current.get("weather_code", 0)
+
+    return (
+        "%.0f°F" % current.get("temperature_2m", 0),
+        "%.0f°F" % current.get("apparent_temperature", 0),
+        "%s%%" % current.get("relative_humidity_2m", 0),
+        _WX_DESC[weather_code] if isinstance(weather_code, int) and 0 <= weather_code < 100 else "unknown",
+        "%.1f mph" % current.get("wind_speed_10m", 0),
+    )
+
+
+def _batch_coordinates(locations: list[tuple[float, float]]) -> tuple[str, str]:
+    """Comma-separated latitudes and longitudes for a multi-location forecast."""
+    return (
+        ",".join(str(lat) for lat, _ in locations),
+        ",".join(str(lon) for _, lon in locations),
+    )
+
+
+def _split_batch(coords: list[tuple | None]) -> tuple[dict, dict]:
+    """Split a batch's locations into cached weather and locations still to fetch.
+
+    Returns:
+        (weather by cache key, (lat, lon) by cache key for the misses)
+    """
+    weathers: dict[tuple, Conditions] = {}
+    missing: dict[tuple, tuple[float, float]] = {}
+    for location in coords:
+        if location is None:
+            continue
+        key = _weather_key(location[0], location[1])
+        if key in weathers or key in missing:
+            continue
+        weather = _WX_CACHE.get(key)
+        if weather is None:
+            missing[key] = (location[0], location[1])
+        else:
+            weathers[key] = weather
+    return weathers, missing
+
+
+def _parse_batch(data: dict | list, keys: list[tuple], weathers: dict) -> None:
+    """Parse a multi-location forecast into `weathers` (and the cache), in request order."""
+    # A single location comes back as an object rather than a one-item list
+    items = data if isinstance(data, list) else [data]
+    if len(items) != len(keys):
+        logger.warning(f"Forecast returned {len(items)} locations for {len(keys)} requested")
+    for key, item in zip(keys, items):
+        weathers[key] = _parse_weather(item)
+        _WX_CACHE.set(key, weathers[key])
+
+
+def _batch_results(cities: list[str], coords: list[tuple | None], weathers: dict, error: Exception | None) -> list[dict]:
+    """Build one get_weather-style result per requested city."""
+    results = []
+    for city, location in zip(cities, coords):
+        if location is None:
+            results.append({"error": f"City '{city}' not found", "city": city})
+            continue
+        lat, lon, city_name, country = location
+        weather = weathers.get(_weather_key(lat, lon))
+        if weather is None and error is None:
+            # The API answered with fewer locations than were requested
+            results.append({"error": f"No forecast returned for '{city}'", "city": city})
+        elif weather is None:
+            results.append(_weather_error(error, city))
+        else:
+            results.append(Weather(city_name, country, *weather)._asdict())
+    return results
+
+
+def _weather_error(e: Exception, city: str) -> dict:
+    """Map a failed forecast request to the tool's error result."""
+    if isinstance(e, httpx.HTTPStatusError):
+        return {"error": f"API error: {e.response.status_code}", "city": city}
+    if isinstance(e, httpx.RequestError):
+        return {"error": f"Request failed: {str(e)}", "city": city}
+    if isinstance(e, orjson.JSONDecodeError):
+        return {"error": f"Invalid API response: {str(e)}", "city": city}
+    return {"error": f"Unexpected error: {str(e)}", "city": city}
+
+
+def _geocode_attempt(query: str, city: str) -> tuple[float, float, str, str] | None:
+    """Run one geocoding query, treating a failed request as a miss."""
+    try:
+        response = _GEO_CLIENT.get(_geocode_url(query))
+    except httpx.RequestError:
+        return None
+    return _coordinates_from_response(response, city)
+
 
 def _get_coordinates(city: str) -> tuple[float, float, str, str] | None:
     """Get latitude and longitude for a city using Open-Meteo geocoding."""
-    # Try the full query first, then just the city name (before comma)
-    queries_to_try = [city]
-    if "," in city:
-        queries_to_try.append(city.split(",")[0].strip())
-    
-    for query in queries_to_try:
+    if not _is_plausible_city(city):
+        return None
+
+    key = _geocode_key(city)
+    if (coords := _cached_coordinates(key)) is not None:
+        return coords
+
+    queries = _geocode_queries(city)
+    if len(queries) == 1:
+        coords = _geocode_attempt(queries[0], city)
+    else:
+        # Send every query at once, but prefer the earliest one that found something
+        futures = [_GEO_EXECUTOR.submit(_geocode_attempt, query, city) for query in queries]
         try:
-            response = httpx.get(
-                GEOCODING_URL,
-                params={"name": query, "count": 5, "language": "en", "format": "json"},
-                timeout=10.0,
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            if data.get("results"):
-                result = data["results"][0]
-                return (
-                    result["latitude"],
-                    result["longitude"],
-                    result.get("name", city),
-                    result.get("country", ""),
-                )
-        except Exception:
+            for future in futures:
+                if coords := future.result():
+                    break
+        finally:
+            for future in futures:
+                future.cancel()
+
+    if coords:
+        _cache_coordinates(key, coords)
+    return coords
+
+
+async def _aget_coordinates(city: str) -> tuple[float, float, str, str] | None:
+    """Async _get_coordinates - every candidate query is sent at once."""
+    if not _is_plausible_city(city):
+        return None
+
+    key = _geocode_key(city)
+    # Memory hits stay on the loop; the SQLite cache (and its first open) runs in a thread
+    if (coords := _GEO_CACHE.get(key)) is not None:
+        return coords
+    if (coords := await asyncio.to_thread(_cached_coordinates, key)) is not None:
+        return coords
+
+    responses = await asyncio.gather(
+        *(_ASYNC_GEO_CLIENT.get(_geocode_url(q)) for q in _geocode_queries(city)),
+        return_exceptions=True,
+    )
+
+    # Prefer the earliest query that found something, as the sync path does
+    for response in responses:
+        if isinstance(response, httpx.RequestError):
             continue
-    
+        if isinstance(response, BaseException):
+            raise response
+        coords = _coordinates_from_response(response, city)
+        if coords:
+            await asyncio.to_thread(_cache_coordinates, key, coords)
+            return coords
+
     return None
 
 
-@tool
-def get_weather(city: str) -> dict:
+def _get_weather(city: str) -> dict:
     """Get the current weather for a city.
     
     Args:
@@ -76,6 +471,9 @@ def get_weather(city: str) -> dict:
     Returns:
         A dictionary with temperature, conditions, humidity, and other weather data.
     """
+    if is_weather_stub_enabled():
+        return _stub_weather(city)
+
     # First, geocode the city
     coords = _get_coordinates(city)
     if not coords:
@@ -83,37 +481,182 @@ def get_weather(city: str) -> dict:
     
     lat, lon, city_name, country = coords
     
-    try:
-        response = httpx.get(
-            WEATHER_URL,
-            params={
-                "latitude": lat,
-                "longitude": lon,
-                "current": "temperature_2m,relative_humidity_2m,apparent_temperature,weather_code,wind_speed_10m",
-                "temperature_unit": "fahrenheit",
-                "wind_speed_unit": "mph",
-                "timezone": "auto",
-            },
-            timeout=10.0,
-        )
-        response.raise_for_status()
-        data = response.json()
+    key = _weather_key(lat, lon)
+    weather = _WX_CACHE.get(key)
+    if weather is None:
+        try:
+            weather = _parse_weather(_fetch_forecast(lat, lon, WEATHER_FIELDS))
+        except Exception as e:
+            return _weather_error(e, city)
+        _WX_CACHE.set(key, weather)
+
+    return Weather(city_name, country, *weather)._asdict()
+
+
+async def _aget_weather(city: str) -> dict:
+    """Async _get_weather, used when the tool is awaited."""
+    if is_weather_stub_enabled():
+        return _stub_weather(city)
+
+    coords = await _aget_coordinates(city)
+    if not coords:
+        return {"error": f"City '{city}' not found", "city": city}
+
+    lat, lon, city_name, country = coords
+
+    key = _weather_key(lat, lon)
+    weather = _WX_CACHE.get(key)
+    if weather is None:
+        try:
+            weather = _parse_weather(await _afetch_forecast(lat, lon, WEATHER_FIELDS))
+        except Exception as e:
+            return _weather_error(e, city)
+        _WX_CACHE.set(key, weather)
+
+    return Weather(city_name, country, *weather)._asdict()
+
+
+def _get_weather_batch(cities: list[str]) -> list[dict]:
+    """Get the current weather for several cities at once.
+    
+    Args:
+        cities: The names of the cities to get weather for.
         
-        current = data.get("current", {})
-        weather_code = current.get("weather_code", 0)
+    Returns:
+        A list with one get_weather result per city, in the same order.
+    """
+    if is_weather_stub_enabled():
+        return [_stub_weather(city) for city in cities]
+
+    coords = [_get_coordinates(city) for city in cities]
+    weathers, missing = _split_batch(coords)
+
+    # One forecast request covers every location that isn't cached
+    error = None
+    if missing:
+        try:
+            data = _fetch_forecast(*_batch_coordinates(list(missing.values())), WEATHER_FIELDS)
+            _parse_batch(data, list(missing), weathers)
+        except Exception as e:
+            error = e
+
+    return _batch_results(cities, coords, weathers, error)
+
+
+async def _aget_weather_batch(cities: list[str]) -> list[dict]:
+    """Async _get_weather_batch - cities are geocoded concurrently."""
+    if is_weather_stub_enabled():
+        return [_stub_weather(city) for city in cities]
+
+    coords = await asyncio.gather(*(_aget_coordinates(city) for city in cities))
+    weathers, missing = _split_batch(coords)
+
+    error = None
+    if missing:
+        try:
+            data = await _afetch_forecast(*_batch_coordinates(list(missing.values())), WEATHER_FIELDS)
+            _parse_batch(data, list(missing), weathers)
+        except Exception as e:
+            error = e
+
+    return _batch_results(cities, coords, weathers, error)
+
+
+def _temperature_result(city_name: str, country: str, data: dict) -> dict:
+    return {"city": city_name, "country": country, "temp": "%.0f°F" % data.get("current", {}).get("temperature_2m", 0)}
+
+
+def _get_temperature(city: str) -> dict:
+    """Get just the current temperature for a city.
+    
+    Args:
+        city: The name of the city to get the temperature for.
         
-        return {
-            "city": city_name,
-            "country": country,
-            "temp": f"{current.get('temperature_2m', 0):.0f}°F",
-            "feels_like": f"{current.get('apparent_temperature', 0):.0f}°F",
-            "humidity": f"{current.get('relative_humidity_2m', 0)}%",
-            "conditions": WEATHER_CODES.get(weather_code, "unknown"),
-            "wind_speed": f"{current.get('wind_speed_10m', 0):.1f} mph",
-        }
-    except httpx.HTTPStatusError as e:
-        return {"error": f"API error: {e.response.status_code}", "city": city}
-    except httpx.RequestError as e:
-        return {"error": f"Request failed: {str(e)}", "city": city}
+    Returns:
+        A dictionary with the city, country, and temperature.
+    """
+    if is_weather_stub_enabled():
+        weather = _stub_weather(city)
+        return {"city": weather["city"], "country": weather["country"], "temp": weather["temp"]}
+
+    coords = _get_coordinates(city)
+    if not coords:
+        return {"error": f"City '{city}' not found", "city": city}
+
+    lat, lon, city_name, country = coords
+
+    # Full conditions cached by get_weather already include the temperature
+    weather = _WX_CACHE.get(_weather_key(lat, lon))
+    if weather is not None:
+        return {"city": city_name, "country": country, "temp": weather[0]}
+
+    try:
+        return _temperature_result(city_name, country, _fetch_forecast(lat, lon, TEMPERATURE_FIELDS))
+    except Exception as e:
+        return _weather_error(e, city)
+
+
+async def _aget_temperature(city: str) -> dict:
+    """Async _get_temperature, used when the tool is awaited."""
+    if is_weather_stub_enabled():
+        return _get_temperature(city)
+
+    coords = await _aget_coordinates(city)
+    if not coords:
+        return {"error": f"City '{city}' not found", "city": city}
+
+    lat, lon, city_name, country = coords
+
+    weather = _WX_CACHE.get(_weather_key(lat, lon))
+    if weather is not None:
+        return {"city": city_name, "country": country, "temp": weather[0]}
+
+    try:
+        return _temperature_result(city_name, country, await _afetch_forecast(lat, lon, TEMPERATURE_FIELDS))
     except Exception as e:
-        return {"error": f"Unexpected error: {str(e)}", "city": city}
+        return _weather_error(e, city)
+
+
+async def prewarm_weather_connections() -> None:
+    """Open pooled connections to both Open-Meteo hosts before the first lookup.
+    
+    Unreachable hosts are ignored - the tool reports its own errors when used.
+    """
+    if is_weather_stub_enabled():
+        return
+
+    async def _head_async(client: httpx.AsyncClient) -> None:
+        try:
+            await client.head("/", timeout=3.0)
+        except httpx.HTTPError as e:
+            logger.info(f"Weather prewarm skipped for {client.base_url}: {e}")
+
+    def _head_sync(client: httpx.Client) -> None:
+        try:
+            client.head("/", timeout=3.0)
+        except httpx.HTTPError as e:
+            logger.info(f"Weather prewarm skipped for {client.base_url}: {e}")
+
+    await asyncio.gather(
+        *(_head_async(client) for client in (_ASYNC_GEO_CLIENT, _ASYNC_WX_CLIENT)),
+        *(asyncio.to_thread(_head_sync, client) for client in (_GEO_CLIENT, _WX_CLIENT)),
+    )
+
+
+get_weather = StructuredTool.from_function(
+    func=_get_weather,
+    coroutine=_aget_weather,
+    name="get_weather",
+)
+
+get_weather_batch = StructuredTool.from_function(
+    func=_get_weather_batch,
+    coroutine=_aget_weather_batch,
+    name="get_weather_batch",
+)
+
+get_temperature = StructuredTool.from_function(
+    func=_get_temperature,
+    coroutine=_aget_temperature,
+    name="get_temperature",
+)
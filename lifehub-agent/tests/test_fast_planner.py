@@ -0,0 +1,80 @@
+"""Tests for the rule-based fast planner."""
+
+import pytest
+
+from backend.agents.fast_planner import fast_plan
+
+
+def _city(message: str) -> str | None:
+    plan = fast_plan(message)
+    if plan is None:
+        return None
+    assert plan[0]["tool"] == "get_weather"
+    return plan[0]["tool_input"]["city"]
+
+
+@pytest.mark.parametrize(
+    ("message", "city"),
+    [
+        ("weather in Paris", "Paris"),
+        ("weather in São Paulo", "São Paulo"),
+        ("weather in Zürich", "Zürich"),
+        ("What's the weather in New York City?", "New York City"),
+        ("weather in Paris, France today", "Paris, France"),
+        ("weather in Paris right now please", "Paris"),
+        ("weather in St. Louis.", "St. Louis"),
+    ],
+)
+def test_weather_city(message, city):
+    assert _city(message) == city
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "What is the weather in Paris like?",
+        "check the weather at my house",
+        "weather in Paris and London",
+        "weather in Paris and add a task to buy milk",
+        "weather in Paris tomorrow",
+        "weather in 12345",
+    ],
+)
+def test_weather_falls_through_to_llm(message):
+    assert fast_plan(message) is None
+
+
+def test_add_task():
+    plan = fast_plan("add a task to buy milk")
+    assert plan[0]["tool"] == "add_task"
+    assert plan[0]["tool_input"] == {"task": "buy milk"}
+    assert plan[0]["speculation_safe"]
+
+
+@pytest.mark.parametrize(
+    ("message", "task"),
+    [
+        ("please add a task to call mom", "call mom"),
+        ("Can you create a task to renew passport.", "renew passport"),
+        ("could you please add task to water plants", "water plants"),
+    ],
+)
+def test_add_task_polite_prefix(message, task):
+    plan = fast_plan(message)
+    assert plan[0]["tool_input"] == {"task": task}
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "Don't add a task to buy milk",
+        "How do I add a task to my list?",
+        "can you create a task to?",
+        "can you add a task to buy milk?",
+        "I said to add a task to buy milk",
+        "please do not create a task to call mom",
+        "add a task",
+    ],
+)
+def test_add_task_falls_through_to_llm(message):
+    assert fast_plan(message) is None
@@ -0,0 +1,150 @@
+"""Tests for the MCP client's tool catalog cache and pooled sessions."""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import anyio
+import pytest
+from mcp.types import CONNECTION_CLOSED, INVALID_PARAMS, CallToolResult, ErrorData, TextContent
+
+import backend.mcp.client as client
+from backend.mcp.client import McpError
+
+
+def _server(name: str = "fake", command: str = "fake-mcp", args: list[str] | None = None) -> dict:
+    return {"name": name, "command": command, "args": args or [], "env": {}, "enabled": True}
+
+
+def test_catalog_key_separates_args():
+    assert client._catalog_key(_server(args=["-y", "pkg"])) != client._catalog_key(_server(args=["-yp", "kg"]))
+
+
+@pytest.fixture
+def catalog(monkeypatch, tmp_path):
+    """Point the catalog cache at a temp file; returns the list of servers connected to."""
+    connected = []
+
+    async def fake_connect(self, config):
+        connected.append(config["name"])
+        return [], [{"name": "echo", "description": "Echo text.", "inputSchema": {"type": "object"}}]
+
+    monkeypatch.setattr(client, "TOOL_CATALOG_CACHE", tmp_path / "mcp_tools.json")
+    monkeypatch.setattr(client.MCPClientManager, "_connect_to_server", fake_connect)
+    return connected
+
+
+def _initialize() -> list[str]:
+    manager = client.MCPClientManager()
+    asyncio.run(manager.initialize())
+    return [tool.name for tool in manager.get_tools()]
+
+
+def test_catalog_is_reused_while_binary_unchanged(monkeypatch, catalog):
+    monkeypatch.setattr(client, "get_mcp_servers", lambda: [_server()])
+    monkeypatch.setattr(client, "_command_mtime", lambda command: 1.0)
+    _initialize()
+    assert _initialize() == ["echo"]
+    assert catalog == ["fake"]
+
+
+def test_catalog_without_binary_mtime_is_revalidated(monkeypatch, catalog):
+    monkeypatch.setattr(client, "get_mcp_servers", lambda: [_server()])
+    monkeypatch.setattr(client, "_command_mtime", lambda command: None)
+    _initialize()
+    _initialize()
+    assert catalog == ["fake", "fake"]
+
+
+class FakeSession:
+    """Stands in for a ClientSession; `fail_with` is raised by the next call."""
+
+    def __init__(self):
+        self.fail_with: BaseException | None = None
+
+    async def call_tool(self, name, arguments):
+        if self.fail_with is not None:
+            error, self.fail_with = self.fail_with, None
+            raise error
+        return CallToolResult(content=[TextContent(type="text", text=f"{name}:{arguments['text']}")])
+
+
+@pytest.fixture
+def sessions(monkeypatch):
+    """Replace server processes with fake sessions; returns the open/close log and the sessions."""
+    log: list[str] = []
+    opened: list[FakeSession] = []
+
+    @asynccontextmanager
+    async def fake_open_session(config, env):
+        if config["command"] == "missing":
+            raise FileNotFoundError(config["command"])
+        session = FakeSession()
+        opened.append(session)
+        log.append("open")
+        try:
+            yield session
+        finally:
+            log.append("close")
+
+    monkeypatch.setattr(client, "_open_session", fake_open_session)
+    return log, opened
+
+
+def _call(manager: client.MCPClientManager, config: dict, text: str = "hi") -> str:
+    manager._server_env.setdefault(config["name"], {})
+    return asyncio.run(manager._execute_mcp_tool(config, "echo", {"text": text}))
+
+
+def test_calls_share_one_pooled_session(sessions):
+    log, _ = sessions
+    manager = client.MCPClientManager()
+    assert _call(manager, _server(), "a") == "echo:a"
+    assert _call(manager, _server(), "b") == "echo:b"
+    assert log == ["open"]
+    asyncio.run(manager.aclose())
+    assert log == ["open", "close"]
+
+
+def test_tool_error_keeps_session(sessions):
+    log, opened = sessions
+    manager = client.MCPClientManager()
+    _call(manager, _server())
+    opened[0].fail_with = McpError(ErrorData(code=INVALID_PARAMS, message="bad text"))
+    with pytest.raises(McpError):
+        _call(manager, _server())
+    assert _call(manager, _server()) == "echo:hi"
+    assert log == ["open"]
+    asyncio.run(manager.aclose())
+
+
+def test_connection_error_reopens_session(sessions):
+    log, opened = sessions
+    manager = client.MCPClientManager()
+    _call(manager, _server())
+    opened[0].fail_with = anyio.ClosedResourceError()
+    with pytest.raises(anyio.ClosedResourceError):
+        _call(manager, _server())
+    assert _call(manager, _server()) == "echo:hi"
+    assert log == ["open", "close", "open"]
+    asyncio.run(manager.aclose())
+
+
+def test_failed_open_raises(sessions):
+    manager = client.MCPClientManager()
+    with pytest.raises(FileNotFoundError):
+        _call(manager, _server(command="missing"))
+
+
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        (McpError(ErrorData(code=CONNECTION_CLOSED, message="closed")), True),
+        (McpError(ErrorData(code=408, message="timed out")), True),
+        (McpError(ErrorData(code=INVALID_PARAMS, message="bad")), False),
+        (anyio.BrokenResourceError(), True),
+        (BrokenPipeError(), True),
+        (ValueError(), False),
+    ],
+)
+def test_is_connection_error(error, expected):
+    assert client._is_connection_error(error) is expected
@@ -0,0 +1,45 @@
+"""Tests for the notes search tool, against a temporary Chroma store."""
+
+import numpy as np
+import pytest
+
+import backend.rag.store as store
+from backend.tools import notes
+
+
+def _embed(text: str) -> np.ndarray:
+    return np.asarray([len(text), text.count("a"), text.count("e")], dtype=np.float32)
+
+
+@pytest.fixture
+def notes_store(monkeypatch, tmp_path):
+    monkeypatch.setattr(store, "CHROMA_PERSIST_DIR", tmp_path)
+    monkeypatch.setattr(notes, "get_single_embedding", lambda text, provider=None: _embed(text))
+    store.get_chroma_client.cache_clear()
+    notes._cached_query_embedding.cache_clear()
+    notes._reset_collection()
+    yield
+    notes._reset_collection()
+    store.get_chroma_client.cache_clear()
+
+
+def _ingest(documents: list[str]) -> None:
+    collection = store.get_notes_collection()
+    collection.add(
+        ids=[str(i) for i in range(len(documents))],
+        documents=documents,
+        embeddings=[_embed(d) for d in documents],
+        metadatas=[{"source": f"note{i}.md"} for i in range(len(documents))],
+    )
+
+
+def test_search_after_reingest(notes_store):
+    _ingest(["pasta recipe"])
+    assert notes.search_notes.invoke({"query": "pasta"})[0]["content"] == "pasta recipe"
+
+    # Re-ingesting deletes and recreates the collection under the open handle
+    store.get_chroma_client().delete_collection("notes")
+    _ingest(["banana bread"])
+
+    results = notes.search_notes.invoke({"query": "bread"})
+    assert results[0]["content"] == "banana bread"
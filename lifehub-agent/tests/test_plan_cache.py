@@ -0,0 +1,42 @@
+"""Tests for adapting cached plans to new requests."""
+
+from backend.agents.plan_cache import _adapt_plan
+
+
+def _weather_plan(city: str) -> list[dict]:
+    return [
+        {"step": 1, "description": f"Get weather for {city}", "tool": "get_weather", "tool_input": {"city": city}},
+        {"step": 2, "description": "Summarize", "tool": None, "tool_input": None},
+    ]
+
+
+def test_query_derived_input_is_refilled():
+    plan = _adapt_plan(_weather_plan("Paris"), "weather in Paris", "weather in Lyon")
+    assert plan[0]["tool_input"] == {"city": "Lyon"}
+    assert plan[0]["description"] == "Get weather for Lyon"
+
+
+def test_input_not_in_cached_goal_is_a_miss():
+    assert _adapt_plan(_weather_plan("Paris, France"), "weather in Paris", "weather in Lyon") is None
+
+
+def test_step_refs_are_kept():
+    plan = [
+        {"step": 1, "description": "Search", "tool": "search_notes", "tool_input": {"query": "pasta"}},
+        {"step": 2, "description": "Add", "tool": "add_task", "tool_input": {"task": "$step_1"}, "depends_on": [1]},
+    ]
+    adapted = _adapt_plan(plan, "find pasta in my notes", "find soup in my notes")
+    assert adapted[0]["tool_input"] == {"query": "soup"}
+    assert adapted[1]["tool_input"] == {"task": "$step_1"}
+
+
+def test_list_input_is_a_miss():
+    plan = [
+        {
+            "step": 1,
+            "description": "Get weather for Paris and London",
+            "tool": "get_weather_batch",
+            "tool_input": {"cities": ["Paris", "London"]},
+        },
+    ]
+    assert _adapt_plan(plan, "weather in Paris and London", "weather in Rome and Berlin") is None
@@ -0,0 +1,70 @@
+"""Tests for the speculative explainer."""
+
+import asyncio
+
+from langchain_core.messages import AIMessageChunk, HumanMessage
+
+from backend.agents.speculation import SPECULATED_RESULT, SpeculativeExplainer
+
+PLAN = [
+    {"step": 1, "description": "Add task: buy milk", "tool": "add_task", "tool_input": {"task": "buy milk"}, "speculation_safe": True},
+    {"step": 2, "description": "Confirm the task and suggest when to shop", "tool": None, "tool_input": None, "depends_on": [1]},
+]
+
+
+class RecordingModel:
+    """Answers speculative and real prompts differently, recording each prompt."""
+
+    def __init__(self, speculative: str, real: str = ""):
+        self._speculative = speculative
+        self._real = real
+        self.prompts: list[str] = []
+
+    async def astream(self, messages):
+        prompt = messages[-1].content
+        self.prompts.append(prompt)
+        answer = self._speculative if SPECULATED_RESULT in prompt else self._real
+        for token in answer.split(" "):
+            await asyncio.sleep(0)
+            yield AIMessageChunk(content=token)
+
+
+def _explain(model: RecordingModel, result: str) -> tuple[str, bool]:
+    async def run():
+        explainer = SpeculativeExplainer(model, [HumanMessage(content="add a task to buy milk")], enabled=True)
+        explainer.set_plan(PLAN)
+        started = explainer._task is not None
+        entry = {"step": 1, "action": "add_task", "result": result}
+        explainer.on_step(entry)
+        state = {"plan": PLAN, "context_log": [entry], "messages": []}
+        return " ".join([token async for token in explainer.stream(state)]), started
+
+    return asyncio.run(run())
+
+
+def test_safe_plan_speculates_from_set_plan():
+    model = RecordingModel("Added buy milk")
+    answer, started = _explain(model, "Task added")
+    assert started
+    assert answer == "Added buy milk"
+    assert len(model.prompts) == 1
+    assert SPECULATED_RESULT in model.prompts[0]
+
+
+def test_failed_step_reruns_with_real_result():
+    model = RecordingModel("Added buy milk", "Could not add the task")
+    answer, started = _explain(model, "Error: tasks file is read-only")
+    assert started
+    assert answer == "Could not add the task"
+    assert "Error: tasks file is read-only" in model.prompts[-1]
+
+
+def test_unsafe_step_waits_for_result():
+    plan = [{**PLAN[0], "speculation_safe": False}, PLAN[1]]
+
+    async def run():
+        explainer = SpeculativeExplainer(RecordingModel("unused"), [], enabled=True)
+        explainer.set_plan(plan)
+        return explainer._task
+
+    assert asyncio.run(run()) is None
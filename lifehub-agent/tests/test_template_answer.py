@@ -0,0 +1,33 @@
+"""Tests for templated single-tool answers."""
+
+import json
+
+from backend.agents.fast_planner import fast_plan
+from backend.agents.graph import template_answer
+
+WEATHER = {
+    "city": "Seattle",
+    "country": "United States",
+    "temp": "55°F",
+    "feels_like": "53°F",
+    "humidity": "80%",
+    "conditions": "slight rain",
+    "wind_speed": "6.0 mph",
+}
+
+
+def _state(plan: list[dict]) -> dict:
+    return {"plan": plan, "context_log": [{"step": 1, "action": "get_weather", "result": json.dumps(WEATHER)}]}
+
+
+def test_fast_plan_uses_template():
+    answer = template_answer(_state(fast_plan("weather in Seattle")))
+    assert answer.startswith("It's currently 55°F and slight rain in Seattle")
+
+
+def test_reasoning_step_falls_through_to_explainer():
+    plan = [
+        {"step": 1, "description": "Get the weather in Seattle", "tool": "get_weather", "tool_input": {"city": "Seattle"}},
+        {"step": 2, "description": "Decide whether an umbrella is needed", "tool": None, "tool_input": None},
+    ]
+    assert template_answer(_state(plan)) is None
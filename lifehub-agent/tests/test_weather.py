@@ -0,0 +1,67 @@
+"""Tests for the weather tools, against a fake Open-Meteo API."""
+
+import httpx
+import pytest
+
+from backend.agents.graph import EXPLAINER_RESULT_MAX_CHARS, summarize_for_explainer
+from backend.tools import weather
+
+CITIES = {
+    "paris": {"latitude": 48.85, "longitude": 2.35, "name": "Paris", "country": "France"},
+    "london": {"latitude": 51.51, "longitude": -0.13, "name": "London", "country": "United Kingdom"},
+    "berlin": {"latitude": 52.52, "longitude": 13.41, "name": "Berlin", "country": "Germany"},
+}
+
+CURRENT = {
+    "temperature_2m": 60.2,
+    "relative_humidity_2m": 70,
+    "apparent_temperature": 58.9,
+    "weather_code": 3,
+    "wind_speed_10m": 5.4,
+}
+
+
+@pytest.fixture
+def open_meteo(monkeypatch, tmp_path):
+    """Route the weather clients to a fake API; returns a dict of knobs."""
+    knobs = {"forecast_limit": None}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/v1/search":
+            result = CITIES.get(request.url.params["name"].lower())
+            return httpx.Response(200, json={"results": [result]} if result else {})
+        count = len(request.url.params["latitude"].split(","))
+        items = [{"current": CURRENT} for _ in range(count)][: knobs["forecast_limit"]]
+        return httpx.Response(200, json=items if count > 1 else items[0])
+
+    transport = httpx.MockTransport(handler)
+    monkeypatch.setattr(weather, "_GEO_CLIENT", httpx.Client(base_url=weather.GEOCODING_HOST, transport=transport))
+    monkeypatch.setattr(weather, "_WX_CLIENT", httpx.Client(base_url=weather.WEATHER_HOST, transport=transport))
+    monkeypatch.setattr(weather, "GEOCODE_DB", tmp_path / "geo.sqlite")
+    monkeypatch.setattr(weather, "_GEO_CACHE", weather._TTLCache(16, 60))
+    monkeypatch.setattr(weather, "_WX_CACHE", weather._TTLCache(16, 60))
+    weather._geo_db.cache_clear()
+    yield knobs
+    weather._geo_db.cache_clear()
+
+
+def test_batch_reports_cities_missing_from_forecast(open_meteo):
+    open_meteo["forecast_limit"] = 2
+    results = weather.get_weather_batch.invoke({"cities": ["Paris", "London", "Berlin"]})
+    assert [r.get("city") for r in results] == ["Paris", "London", "Berlin"]
+    assert "error" not in results[0] and "error" not in results[1]
+    assert results[2]["error"] == "No forecast returned for 'Berlin'"
+
+
+def test_batch_summary_keeps_every_city(open_meteo):
+    results = weather.get_weather_batch.invoke({"cities": ["Paris", "London", "Berlin"]})
+    summary = summarize_for_explainer("get_weather_batch", results)
+    assert len(summary) == 3
+    assert all(len(item) <= EXPLAINER_RESULT_MAX_CHARS for item in summary)
+    assert "Berlin" in summary[2]
+
+
+@pytest.mark.parametrize("code", [None, 250, "3"])
+def test_unusable_weather_code_is_unknown(code):
+    conditions = weather._parse_weather({"current": {**CURRENT, "weather_code": code}})
+    assert conditions[3] == "unknown"
@@ -0,0 +1,59 @@
+"""Tests for plan execution in the multi-agent graph, with fake models and tools."""
+
+import asyncio
+import json
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.tools import tool
+
+import backend.agents.graph as graph
+
+
+class FakeModel(GenericFakeChatModel):
+    temperature: float = 0.0
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+
+def _run(monkeypatch, plan: list[dict], tools: list) -> dict:
+    def fake_client(provider="openai", temperature=0.7, streaming=True, **kwargs):
+        content = "Final answer." if streaming else json.dumps({"plan": plan})
+        return FakeModel(messages=iter([AIMessage(content=content)] * 10), temperature=temperature)
+
+    monkeypatch.setattr(graph, "get_model_client", fake_client)
+    graph._get_role_model.cache_clear()
+    try:
+        app = graph.create_multi_agent_graph("openai", mcp_tools=tools)
+        state = {"messages": [HumanMessage(content="test request")], "plan": None, "current_step": 0, "context_log": [], "final_answer": None}
+        return asyncio.run(app.ainvoke(state))
+    finally:
+        graph._get_role_model.cache_clear()
+
+
+def test_failed_dependency_skips_dependent_step(monkeypatch):
+    recorded = []
+
+    @tool
+    def lookup(query: str) -> str:
+        """Look something up."""
+        raise RuntimeError("service down")
+
+    @tool
+    def record(text: str) -> str:
+        """Record some text."""
+        recorded.append(text)
+        return "recorded"
+
+    plan = [
+        {"step": 1, "description": "Look up", "tool": "lookup", "tool_input": {"query": "x"}},
+        {"step": 2, "description": "Record", "tool": "record", "tool_input": {"text": "$step_1"}, "depends_on": [1]},
+        {"step": 3, "description": "Summarize", "tool": None, "tool_input": None, "depends_on": [2]},
+    ]
+    out = _run(monkeypatch, plan, [lookup, record])
+
+    log = {entry["step"]: entry for entry in out["context_log"]}
+    assert recorded == []
+    assert log[1]["result"].startswith("Error:")
+    assert log[2]["result"] == "Error: skipped: dependency step 1 failed"